@@ -1,5 +1,6 @@
 import pygame
 import sys
+from functools import lru_cache, partial
 
 # Initialize Pygame
 pygame.init()
@@ -20,14 +21,25 @@ GRAY_300 = (209, 213, 219)
 GRAY_500 = (107, 114, 128)
 BORDER_COLOR = (229, 231, 235)
 
-# Fonts
-font_xl = pygame.font.Font(None, 24)  # text-xl
-font_lg = pygame.font.Font(None, 20)  # text-lg
-font_base = pygame.font.Font(None, 16)  # base text
+# NOTE: ControlPanel presents with flip(). Any redraw repaints the whole panel
+# (tab background plus all content), so there is no smaller dirty region to
+# pass to update(rects). The _dirty flag only skips frames where nothing changed.
+
+# Fonts (created lazily on first use): 24 = text-xl, 20 = text-lg, 16 = base text
+@lru_cache(maxsize=None)
+def _font(size):
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(None, size)
 
 class ControlPanel:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # SCALED uses SDL2's GPU renderer, so flip() is a texture present
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # vsync not available on this driver
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Control Panel")
         self.clock = pygame.time.Clock()
         
@@ -47,6 +59,14 @@ class ControlPanel:
         # TikTok state
         self.username_text = ""
         self.username_active = False
+        self._caret_visible = True
+        
+        # Redraw only when state changes
+        self._dirty = True
+        
+        # Held +/- button auto-repeat: (value attribute, sign, rect)
+        self._pressed_button = None
+        self._press_start = 0
         
         # UI elements
         self.setup_ui_elements()
@@ -63,6 +83,11 @@ class ControlPanel:
         self.shimeji_tab = pygame.Rect(67, tab_y, tab_width, tab_height)
         self.general_tab = pygame.Rect(267, tab_y, tab_width, tab_height)
         self.tiktok_tab = pygame.Rect(467, tab_y, tab_width, tab_height)
+        self.tabs = [
+            (self.shimeji_tab, "shimeji"),
+            (self.general_tab, "general"),
+            (self.tiktok_tab, "tiktok")
+        ]
         
         # Button dimensions
         self.btn_width = 40
@@ -70,184 +95,261 @@ class ControlPanel:
         self.counter_width = 120
         self.counter_height = 40
         
-    def draw_button(self, rect, text, color, text_color, font=None, align_left=False):
+        # Counter layout per tab: (x, y, title, rect attribute prefix, value attribute)
+        self.counters = {
+            "shimeji": [
+                (30, 130, "spawn", "shimeji", "spawn_count"),
+            ],
+            "general": [
+                (30, 130, "Floor", "floor", "floor_value"),
+                (250, 130, "Ceiling", "ceiling", "ceiling_value"),
+                # Gap between floor-ceiling and walls sections (added 20px gap)
+                (30, 220, "Left Wall", "left_wall", "left_wall_value"),
+                (250, 220, "Right Wall", "right_wall", "right_wall_value"),
+            ],
+        }
+        
+        # Layout is static, so counter rects are computed once
+        for counters in self.counters.values():
+            for x, y, title, prefix, attr in counters:
+                minus_rect, counter_rect, plus_rect = self.counter_rects(x, y)
+                setattr(self, prefix + "_minus", minus_rect)
+                setattr(self, prefix + "_counter", counter_rect)
+                setattr(self, prefix + "_plus", plus_rect)
+                
+        # TikTok widgets
+        self.username_rect = pygame.Rect(30, 140, 300, 40)
+        self.connect_rect = pygame.Rect(350, 140, 120, 40)
+        
+        # Click dispatch table per tab: [(rect, callback), ...]
+        self._click_map = {"shimeji": [], "general": [], "tiktok": []}
+        for tab_name, counters in self.counters.items():
+            for x, y, title, prefix, attr in counters:
+                self._click_map[tab_name].append((getattr(self, prefix + "_minus"), partial(self.adjust_counter, attr, -1)))
+                self._click_map[tab_name].append((getattr(self, prefix + "_plus"), partial(self.adjust_counter, attr, 1)))
+        self._click_map["tiktok"].append((self.connect_rect, self.toggle_connect))
+        
+        # Rendered text cache for fixed labels only: (id(font), text, color) -> Surface.
+        # Counter values and the username change freely, so they are rendered
+        # per redraw instead of growing this dict without bound.
+        self._text_cache = {}
+        
+        # Counter value box frame, shared by every counter
+        self._counter_frame = pygame.Surface((self.counter_width, self.counter_height)).convert()
+        frame_rect = self._counter_frame.get_rect()
+        pygame.draw.rect(self._counter_frame, WHITE, frame_rect)
+        pygame.draw.rect(self._counter_frame, BORDER_COLOR, frame_rect, 2)
+        
+        # Connect button in both states, keyed by is_connected
+        self._connect_surfs = {
+            False: self._make_button(self.connect_rect.size, "Connect", YELLOW_800, WHITE),
+            True: self._make_button(self.connect_rect.size, "Connected", GREEN_800, WHITE),
+        }
+        
+        # Username input field, keyed by username_active
+        self._input_surfs = {}
+        for active, border in ((False, BORDER_COLOR), (True, BLUE_500)):
+            surface = pygame.Surface(self.username_rect.size).convert()
+            surface.fill(WHITE)
+            pygame.draw.rect(surface, border, surface.get_rect(), 2)
+            self._input_surfs[active] = surface
+            
+        # Caret spans the full line height of the username font, inclusive
+        self._caret = pygame.Surface((1, _font(16).get_height() + 1)).convert()
+        self._caret.fill(BLACK)
+        
+        # Static chrome pre-composited once per tab
+        self._tab_bg = {}
+        for tab_name in ("shimeji", "general", "tiktok"):
+            surface = pygame.Surface((PANEL_WIDTH, PANEL_HEIGHT)).convert()
+            self.draw_tab_background(surface, tab_name)
+            self._tab_bg[tab_name] = surface
+        
+    def _text(self, font, s, color):
+        """Return a cached rendered surface for a fixed label"""
+        key = (id(font), s, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(s, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+        
+    def draw_button(self, rect, text, color, text_color, font=None, align_left=False, surface=None):
         if font is None:
-            font = font_base
+            font = _font(16)
+        if surface is None:
+            surface = self.screen
             
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, BORDER_COLOR, rect, 2)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, BORDER_COLOR, rect, 2)
         
-        text_surface = font.render(text, True, text_color)
+        text_surface = self._text(font, text, text_color)
         if align_left:
             text_rect = text_surface.get_rect()
             text_rect.centery = rect.centery
             text_rect.x = rect.x + 10  # 10px padding from left
         else:
             text_rect = text_surface.get_rect(center=rect.center)
-        self.screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
         
-    def draw_counter(self, x, y, value, title):
-        # Title
-        title_surface = font_lg.render(title, True, BLACK)
-        self.screen.blit(title_surface, (x, y))
+    def _make_button(self, size, text, color, text_color):
+        """Pre-render a button into its own surface"""
+        surface = pygame.Surface(size).convert()
+        self.draw_button(surface.get_rect(), text, color, text_color, surface=surface)
+        return surface
         
-        # Counter elements
+    def counter_rects(self, x, y):
         minus_rect = pygame.Rect(x, y + 30, self.btn_width, self.btn_height)
         counter_rect = pygame.Rect(x + self.btn_width + 5, y + 30, self.counter_width, self.counter_height)
         plus_rect = pygame.Rect(x + self.btn_width + self.counter_width + 10, y + 30, self.btn_width, self.btn_height)
-        
-        # Draw buttons and counter
-        self.draw_button(minus_rect, "-", WHITE, BLACK)
-        self.draw_button(counter_rect, str(value), WHITE, BLACK)
-        self.draw_button(plus_rect, "+", WHITE, BLACK)
-        
-        return minus_rect, plus_rect
-        
-    def draw_tabs(self):
+        return minus_rect, counter_rect, plus_rect
+        
+    def draw_counters(self, overlays, counters):
+        # Only the value boxes change; titles and +/- live in the tab background.
+        # Frames first, then values, so no value is covered by a later frame.
+        values = []
+        for prefix, value in counters:
+            rect = getattr(self, prefix + "_counter")
+            overlays.append((self._counter_frame, rect.topleft))
+            text_surface = _font(16).render(str(value), True, BLACK)
+            values.append((text_surface, text_surface.get_rect(center=rect.center)))
+        overlays.extend(values)
+        
+    def draw_tabs(self, surface, selected_tab):
         # Tab buttons
-        tabs = [
-            (self.shimeji_tab, "shimeji"),
-            (self.general_tab, "general"), 
-            (self.tiktok_tab, "tiktok")
-        ]
-        
-        for rect, tab_name in tabs:
-            if self.selected_tab == tab_name:
+        for rect, tab_name in self.tabs:
+            if selected_tab == tab_name:
                 color = BLUE_500
                 text_color = WHITE
             else:
                 color = WHITE
                 text_color = BLACK
                 
-            self.draw_button(rect, tab_name, color, text_color, font_base, align_left=True)
+            self.draw_button(rect, tab_name, color, text_color, _font(16), align_left=True, surface=surface)
             
         # Tab separator line
-        pygame.draw.line(self.screen, BORDER_COLOR, (20, 80), (780, 80), 2)
-        
-    def draw_shimeji_content(self):
-        # Initial Spawn section
-        title_surface = font_xl.render("Initial Spawn", True, BLACK)
-        self.screen.blit(title_surface, (30, 100))
-        
-        # Counter
-        self.shimeji_minus, self.shimeji_plus = self.draw_counter(30, 130, self.spawn_count, "spawn")
-        
-        # Section separator (moved down)
-        pygame.draw.line(self.screen, GRAY_300, (30, 210), (770, 210), 1)
-        
-    def draw_general_content(self):
-        # Boundaries section
-        title_surface = font_xl.render("Boundaries", True, BLACK)
-        self.screen.blit(title_surface, (30, 100))
-        
-        # Floor and Ceiling
-        self.floor_minus, self.floor_plus = self.draw_counter(30, 130, self.floor_value, "Floor")
-        self.ceiling_minus, self.ceiling_plus = self.draw_counter(250, 130, self.ceiling_value, "Ceiling")
-        
-        # Gap between floor-ceiling and walls sections (added 20px gap)
-        # Left Wall and Right Wall  
-        self.left_wall_minus, self.left_wall_plus = self.draw_counter(30, 220, self.left_wall_value, "Left Wall")
-        self.right_wall_minus, self.right_wall_plus = self.draw_counter(250, 220, self.right_wall_value, "Right Wall")
-        
-        # Section separator (moved down)
-        pygame.draw.line(self.screen, GRAY_300, (30, 300), (770, 300), 1)
-        
-    def draw_tiktok_content(self):
-        # Username section
-        title_surface = font_xl.render("Username:", True, BLACK)
-        self.screen.blit(title_surface, (30, 100))
-        
+        pygame.draw.line(surface, BORDER_COLOR, (20, 80), (780, 80), 2)
+        
+    def draw_tab_background(self, surface, tab_name):
+        """Render everything that never changes for a given tab"""
+        # Clear and draw panel border
+        surface.fill(WHITE)
+        pygame.draw.rect(surface, WHITE, self.panel_rect)
+        pygame.draw.rect(surface, BORDER_COLOR, self.panel_rect, 2)
+        
+        # Tabs
+        self.draw_tabs(surface, tab_name)
+        
+        # Section title
+        titles = {"shimeji": "Initial Spawn", "general": "Boundaries", "tiktok": "Username:"}
+        surface.blit(self._text(_font(24), titles[tab_name], BLACK), (30, 100))
+        
+        # Counter titles and +/- buttons
+        for x, y, title, prefix, attr in self.counters.get(tab_name, ()):
+            surface.blit(self._text(_font(20), title, BLACK), (x, y))
+            self.draw_button(getattr(self, prefix + "_minus"), "-", WHITE, BLACK, surface=surface)
+            self.draw_button(getattr(self, prefix + "_plus"), "+", WHITE, BLACK, surface=surface)
+            
+        # Section separator
+        if tab_name == "shimeji":
+            pygame.draw.line(surface, GRAY_300, (30, 210), (770, 210), 1)
+        elif tab_name == "general":
+            pygame.draw.line(surface, GRAY_300, (30, 300), (770, 300), 1)
+        elif tab_name == "tiktok":
+            # Input info
+            surface.blit(self._text(_font(16), "input tanpa @", GRAY_500), (30, 185))
+            pygame.draw.line(surface, GRAY_300, (30, 220), (770, 220), 1)
+        
+    def draw_shimeji_content(self, overlays):
+        self.draw_counters(overlays, [("shimeji", self.spawn_count)])
+        
+    def draw_general_content(self, overlays):
+        self.draw_counters(overlays, [
+            ("floor", self.floor_value),
+            ("ceiling", self.ceiling_value),
+            ("left_wall", self.left_wall_value),
+            ("right_wall", self.right_wall_value),
+        ])
+        
+    def draw_tiktok_content(self, overlays):
         # Input field
-        self.username_rect = pygame.Rect(30, 140, 300, 40)
-        input_color = WHITE
-        if self.username_active:
-            pygame.draw.rect(self.screen, input_color, self.username_rect)
-            pygame.draw.rect(self.screen, BLUE_500, self.username_rect, 2)
-        else:
-            pygame.draw.rect(self.screen, input_color, self.username_rect)
-            pygame.draw.rect(self.screen, BORDER_COLOR, self.username_rect, 2)
+        overlays.append((self._input_surfs[self.username_active], self.username_rect))
             
         # Username text
         if self.username_text:
-            text_surface = font_base.render(self.username_text, True, BLACK)
+            text_surface = _font(16).render(self.username_text, True, BLACK)
         else:
-            text_surface = font_base.render("Masukkan username TikTok", True, GRAY_500)
+            text_surface = self._text(_font(16), "Masukkan username TikTok", GRAY_500)
         
         text_rect = text_surface.get_rect()
         text_rect.centery = self.username_rect.centery
         text_rect.x = self.username_rect.x + 10
-        self.screen.blit(text_surface, text_rect)
+        overlays.append((text_surface, text_rect))
         
-        # Input info
-        info_surface = font_base.render("input tanpa @", True, GRAY_500)
-        self.screen.blit(info_surface, (30, 185))
+        # Blinking caret
+        if self.username_active and self._caret_visible:
+            caret_x = text_rect.right + 2 if self.username_text else text_rect.x
+            overlays.append((self._caret, (caret_x, text_rect.top)))
         
         # Connect button
-        self.connect_rect = pygame.Rect(350, 140, 120, 40)
-        if self.is_connected:
-            color = GREEN_800
-            text = "Connected"
-        else:
-            color = YELLOW_800
-            text = "Connect"
-            
-        self.draw_button(self.connect_rect, text, color, WHITE)
-        
-        # Section separator
-        pygame.draw.line(self.screen, GRAY_300, (30, 220), (770, 220), 1)
+        overlays.append((self._connect_surfs[self.is_connected], self.connect_rect))
         
     def handle_click(self, pos):
         # Tab clicks
-        if self.shimeji_tab.collidepoint(pos):
-            self.selected_tab = "shimeji"
-        elif self.general_tab.collidepoint(pos):
-            self.selected_tab = "general"
-        elif self.tiktok_tab.collidepoint(pos):
-            self.selected_tab = "tiktok"
-            
-        # Content clicks based on selected tab
-        if self.selected_tab == "shimeji":
-            if hasattr(self, 'shimeji_minus') and self.shimeji_minus.collidepoint(pos):
-                self.spawn_count = max(0, self.spawn_count - 1)
-            elif hasattr(self, 'shimeji_plus') and self.shimeji_plus.collidepoint(pos):
-                self.spawn_count += 1
-                
-        elif self.selected_tab == "general":
-            # Floor controls
-            if hasattr(self, 'floor_minus') and self.floor_minus.collidepoint(pos):
-                self.floor_value = max(0, self.floor_value - 1)
-            elif hasattr(self, 'floor_plus') and self.floor_plus.collidepoint(pos):
-                self.floor_value += 1
+        for rect, tab_name in self.tabs:
+            if rect.collidepoint(pos):
+                self.selected_tab = tab_name
+                break
                 
-            # Ceiling controls
-            if hasattr(self, 'ceiling_minus') and self.ceiling_minus.collidepoint(pos):
-                self.ceiling_value = max(0, self.ceiling_value - 1)
-            elif hasattr(self, 'ceiling_plus') and self.ceiling_plus.collidepoint(pos):
-                self.ceiling_value += 1
-                
-            # Left wall controls
-            if hasattr(self, 'left_wall_minus') and self.left_wall_minus.collidepoint(pos):
-                self.left_wall_value = max(0, self.left_wall_value - 1)
-            elif hasattr(self, 'left_wall_plus') and self.left_wall_plus.collidepoint(pos):
-                self.left_wall_value += 1
-                
-            # Right wall controls
-            if hasattr(self, 'right_wall_minus') and self.right_wall_minus.collidepoint(pos):
-                self.right_wall_value = max(0, self.right_wall_value - 1)
-            elif hasattr(self, 'right_wall_plus') and self.right_wall_plus.collidepoint(pos):
-                self.right_wall_value += 1
-                
-        elif self.selected_tab == "tiktok":
-            # Username input
-            if hasattr(self, 'username_rect') and self.username_rect.collidepoint(pos):
-                self.username_active = True
-            else:
-                self.username_active = False
-                
-            # Connect button
-            if hasattr(self, 'connect_rect') and self.connect_rect.collidepoint(pos):
-                self.is_connected = not self.is_connected
+        # Content clicks based on selected tab
+        if self.selected_tab == "tiktok":
+            # Username input gains focus on click, loses it anywhere else
+            self.username_active = self.username_rect.collidepoint(pos)
+            
+        for rect, callback in self._click_map[self.selected_tab]:
+            if rect.collidepoint(pos):
+                callback()
+                break
                 
+        self._dirty = True
+        
+    def toggle_connect(self):
+        self.is_connected = not self.is_connected
+        
+    def adjust_counter(self, attr, delta):
+        setattr(self, attr, max(0, getattr(self, attr) + delta))
+        self._dirty = True
+        
+    def counter_button_at(self, pos):
+        """Return (value attribute, sign, rect) of the +/- button under pos"""
+        for x, y, title, prefix, attr in self.counters.get(self.selected_tab, ()):
+            minus_rect = getattr(self, prefix + "_minus")
+            if minus_rect.collidepoint(pos):
+                return attr, -1, minus_rect
+            plus_rect = getattr(self, prefix + "_plus")
+            if plus_rect.collidepoint(pos):
+                return attr, 1, plus_rect
+        return None
+        
+    def update_held_button(self):
+        """Auto-repeat a held +/- button, accelerating the longer it is held"""
+        if self._pressed_button is None:
+            return
+        attr, sign, rect = self._pressed_button
+        if not pygame.mouse.get_pressed()[0] or not rect.collidepoint(pygame.mouse.get_pos()):
+            return
+        
+        held = pygame.time.get_ticks() - self._press_start
+        if held <= 300:
+            return
+        if held < 1000:
+            step = 1
+        elif held < 2000:
+            step = 5
+        else:
+            step = 25
+        self.adjust_counter(attr, sign * step)
+        
     def handle_keydown(self, event):
         if self.selected_tab == "tiktok" and self.username_active:
             if event.key == pygame.K_BACKSPACE:
@@ -256,6 +358,7 @@ class ControlPanel:
                 # Only allow alphanumeric and some special characters
                 if event.unicode.isprintable() and len(self.username_text) < 30:
                     self.username_text += event.unicode
+            self._dirty = True
                     
     def run(self):
         running = True
@@ -267,28 +370,44 @@ class ControlPanel:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
                         self.handle_click(event.pos)
+                        self._pressed_button = self.counter_button_at(event.pos)
+                        self._press_start = pygame.time.get_ticks()
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    if event.button == 1:
+                        self._pressed_button = None
                 elif event.type == pygame.KEYDOWN:
                     self.handle_keydown(event)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._dirty = True
                     
-            # Clear screen
-            self.screen.fill(WHITE)
+            # One coalesced counter change per tick while a +/- is held
+            self.update_held_button()
             
-            # Draw panel border
-            pygame.draw.rect(self.screen, WHITE, self.panel_rect)
-            pygame.draw.rect(self.screen, BORDER_COLOR, self.panel_rect, 2)
-            
-            # Draw tabs
-            self.draw_tabs()
+            # Caret blinks at 2 Hz while the username field is focused
+            if self.username_active:
+                caret_visible = (pygame.time.get_ticks() // 500) % 2 == 0
+                if caret_visible != self._caret_visible:
+                    self._caret_visible = caret_visible
+                    self._dirty = True
+                    
+            if self._dirty:
+                # Static chrome for the active tab
+                self.screen.blit(self._tab_bg[self.selected_tab], (0, 0))
             
-            # Draw content based on selected tab
-            if self.selected_tab == "shimeji":
-                self.draw_shimeji_content()
-            elif self.selected_tab == "general":
-                self.draw_general_content()
-            elif self.selected_tab == "tiktok":
-                self.draw_tiktok_content()
+                # Collect content for the selected tab and blit it in one call
+                overlays = []
+                if self.selected_tab == "shimeji":
+                    self.draw_shimeji_content(overlays)
+                elif self.selected_tab == "general":
+                    self.draw_general_content(overlays)
+                elif self.selected_tab == "tiktok":
+                    self.draw_tiktok_content(overlays)
+                self.screen.blits(overlays, doreturn=False)
+                
+                # Always present the whole frame (see NOTE at top of module)
+                pygame.display.flip()
+                self._dirty = False
                 
-            pygame.display.flip()
             self.clock.tick(60)
             
         pygame.quit()
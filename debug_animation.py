@@ -10,6 +10,7 @@ import sys
 import os
 import pygame
 import time
+from bisect import bisect_right
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -19,14 +20,24 @@ from src.animation.animation_manager import AnimationManager
 from src.animation.sprite_loader import SpriteLoader
 from src.utils.log_manager import get_logger
 
+def advance(frame_end_times, timer, delta_time, total_duration):
+    """Advance an animation timer and return (timer, frame) for it"""
+    timer = (timer + delta_time) % total_duration
+    return timer, bisect_right(frame_end_times, timer)
+
 def test_animation_system():
     """Test animation system secara terpisah"""
     print("🔍 Testing Animation System...")
     
+    # Presentation is opt-in (DEBUG_SHOW=1) so the loop times update_animation only
+    show = bool(os.environ.get('DEBUG_SHOW'))
+    
     # Initialize pygame
     pygame.init()
-    screen = pygame.display.set_mode((800, 600))
-    clock = pygame.time.Clock()
+    if show:
+        screen = pygame.display.set_mode((800, 600))
+    else:
+        screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
     
     # Initialize components
     logger = get_logger("debug_animation")
@@ -75,10 +86,10 @@ def test_animation_system():
             
             # Test animation loop
             print("🔄 Testing animation loop...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             frame_count = 0
             
-            for i in range(60):  # 60 frames at 60 FPS = 1 second
+            for i in range(60):  # 60 simulated frames at 60 FPS = 1 second
                 delta_time = 1.0 / 60.0  # 16.67ms
                 
                 # Update animation
@@ -90,14 +101,13 @@ def test_animation_system():
                     frame_count += 1
                     
                     # Draw to screen
-                    screen.fill((0, 0, 0))
-                    screen.blit(current_image, (400, 300))
-                    pygame.display.flip()
-                
-                clock.tick(60)
+                    if show:
+                        screen.fill((0, 0, 0))
+                        screen.blit(current_image, (400, 300))
+                        pygame.display.flip()
             
-            elapsed_time = time.time() - start_time
-            print(f"Animation test completed in {elapsed_time:.2f}s")
+            elapsed_time = time.perf_counter() - start_time
+            print(f"Animation test completed in {elapsed_time * 1000:.2f}ms")
             print(f"Frame updates: {frame_count}")
             
             # Check if animation actually changed frames
@@ -177,12 +187,58 @@ def test_frame_timing():
         else:
             print(f"Step {step}: Frame {old_frame} (no change)")
     
+    # Microbenchmark the frame math alone
+    iterations = int(os.environ.get('DEBUG_ITERATIONS', 10000))
+    frame_end_times = anim_manager.frame_end_times
+    total_duration = anim_manager.total_duration
+    start_timer = anim_manager.animation_timer
+    timer = start_timer
+    start = time.perf_counter()
+    for _ in range(iterations):
+        timer, frame = advance(frame_end_times, timer, 0.1, total_duration)
+    elapsed = time.perf_counter() - start
+    print(f"\n⚡ {iterations} frame advances in {elapsed * 1000:.2f} ms")
+    bench_result = (timer, frame)
+    
+    # Cross-check: step advance() and update_animation from the same timer
+    # with the same deltas (including skips past the end) and compare every frame
+    print("\n🔁 Cross-checking advance() against update_animation...")
+    sound_enabled = anim_manager.sound_enabled
+    anim_manager.sound_enabled = False  # frame sounds would fire on every step
+    deltas = (0.1, 0.016, 0.033, total_duration * 2.5, 0.25)
+    timer = start_timer
+    try:
+        for step in range(iterations):
+            delta_time = deltas[step % len(deltas)]
+            timer, frame = advance(frame_end_times, timer, delta_time, total_duration)
+            anim_manager.update_animation(delta_time)
+            if frame != anim_manager.current_frame:
+                print(f"❌ Step {step} (dt={delta_time}): advance() picked frame {frame}, "
+                      f"update_animation picked {anim_manager.current_frame}")
+                return False
+        
+        # Replay the benchmark's fixed step and check it lands on the same state
+        anim_manager.animation_timer = start_timer
+        for _ in range(iterations):
+            anim_manager.update_animation(0.1)
+        if (anim_manager.animation_timer, anim_manager.current_frame) != bench_result:
+            print(f"❌ Benchmark ended at {bench_result}, update_animation at "
+                  f"{(anim_manager.animation_timer, anim_manager.current_frame)}")
+            return False
+    finally:
+        anim_manager.sound_enabled = sound_enabled
+    print(f"✅ {iterations} steps matched")
+    
     return True
 
 def test_sprite_loading():
     """Test sprite loading issues"""
     print("\n🖼️ Testing sprite loading...")
     
+    # Display must exist before loading so sprites get converted to its format
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    
     sprite_loader = SpriteLoader()
     
     # Test loading specific sprites
@@ -195,7 +251,9 @@ def test_sprite_loading():
     for sprite_path in test_sprites:
         sprite = sprite_loader.load_sprite(sprite_path)
         if sprite:
-            print(f"✅ Loaded: {sprite_path} ({sprite.get_width()}x{sprite.get_height()})")
+            print(f"✅ Loaded: {sprite_path} ({sprite.get_width()}x{sprite.get_height()}, {sprite.get_bitsize()}-bit)")
+            if not sprite.get_flags() & pygame.SRCALPHA:
+                print(f"⚠️ Not per-pixel alpha: {sprite_path}")
         else:
             print(f"❌ Failed to load: {sprite_path}")
     
@@ -12,7 +12,8 @@ Usage:
 
 import sys
 import os
-import subprocess
+import runpy
+import traceback
 
 def main():
     """Main entry point for the desktop pet application"""
@@ -39,22 +40,32 @@ def main():
         print()
     
     print("🚀 Starting Desktop Pet Application...")
-    print("📋 Using: python -m src.main")
+    print("📋 Using: src.main (in-process)")
     print()
     
+    # Resolve `src` from the current directory, like `python -m` would
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    
     try:
-        # Run the application as a module
-        result = subprocess.run([sys.executable, '-m', 'src.main'], 
-                              cwd=os.getcwd(),
-                              check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Application exited with error code: {e.returncode}")
-        return e.returncode
+        # Run the application as a module in this interpreter (no second startup)
+        runpy.run_module('src.main', run_name='__main__', alter_sys=True)
+        return 0
+    except SystemExit as e:
+        # Preserve the exit-code semantics of `python -m src.main`
+        if e.code is None or e.code == 0:
+            return 0
+        if isinstance(e.code, int):
+            print(f"❌ Application exited with error code: {e.code}")
+            return e.code
+        print(e.code)
+        return 1
     except KeyboardInterrupt:
         print("\n👋 Application interrupted by user")
         return 0
     except Exception as e:
+        # Keep the crash traceback; a subprocess used to show it on stderr
+        print(traceback.format_exc())
         print(f"❌ Unexpected error: {e}")
         return 1
 
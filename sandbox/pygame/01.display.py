@@ -2,12 +2,17 @@ import pygame
 
 pygame.init()
 
-display = pygame.display.set_mode((800, 600))
+try:
+    display = pygame.display.set_mode((800, 600), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+except pygame.error:
+    # vsync not available on this driver
+    display = pygame.display.set_mode((800, 600), pygame.SCALED | pygame.DOUBLEBUF)
 
 run = True
 while run:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            run = False
+    # Nothing is drawn per frame, so block until the next event instead of polling
+    event = pygame.event.wait()
+    if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        run = False
 
 pygame.quit()
\ No newline at end of file
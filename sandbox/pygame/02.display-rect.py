@@ -1,5 +1,8 @@
 import pygame
 
+# Movement per frame for each key; held keys add up, so diagonals work
+_DIRS = ((pygame.K_a, -1, 0), (pygame.K_d, 1, 0), (pygame.K_w, 0, -1), (pygame.K_s, 0, 1))
+
 pygame.init()
 
 display = pygame.display.set_mode((800, 600))
@@ -25,14 +28,13 @@ while run:
     #     player_rect.y += 1
     
     key = pygame.key.get_pressed()
-    if key[pygame.K_a]:
-        player_rect.move_ip(-1, 0)
-    elif key[pygame.K_d]:
-        player_rect.move_ip(1, 0)
-    elif key[pygame.K_w]:
-        player_rect.move_ip(0, -1)
-    elif key[pygame.K_s]:
-        player_rect.move_ip(0, 1)
+    dx = dy = 0
+    for k, mx, my in _DIRS:
+        pressed = key[k]
+        dx += pressed * mx
+        dy += pressed * my
+    if dx or dy:
+        player_rect.move_ip(dx, dy)
     
     for event in pygame.event.get():
         if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
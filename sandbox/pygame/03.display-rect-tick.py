@@ -1,33 +1,41 @@
+# NOTE: drain the event queue exactly once per frame, *before* reading
+# pygame.key.get_pressed() - the key state is only refreshed when the queue
+# is pumped, and a second event.get() in the same frame drops events.
 import pygame
 
 pygame.init()
 pygame.display.set_caption("Display Rect Tick Example")
 clock = pygame.time.Clock()
-display = pygame.display.set_mode((800, 600))
+try:
+    display = pygame.display.set_mode((800, 600), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+except pygame.error:
+    # vsync not available on this driver
+    display = pygame.display.set_mode((800, 600), pygame.SCALED | pygame.DOUBLEBUF)
 
 
 player_rect = pygame.Rect(100, 100, 50, 50)  # Example rectangle
+pos_x, pos_y = float(player_rect.x), float(player_rect.y)  # Rect is int-only; keep the fraction here
+speed = 200  # pixels per second
 
 run = True
 while run:
     
-    clock.tick(60)  # Limit the frame rate to 60 FPS
+    dt = clock.tick(60) / 1000.0  # Limit the frame rate to 60 FPS, seconds since last frame
     display.fill((0, 0, 0))  # Clear the display with white background
     
     pygame.draw.rect(display, (0, 128, 255), player_rect)  # Draw the rectangle
     
     
+    events = pygame.event.get()  # pumps the queue, refreshing key state
     key = pygame.key.get_pressed()
-    if key[pygame.K_a]:
-        player_rect.move_ip(-1, 0)
-    elif key[pygame.K_d]:
-        player_rect.move_ip(1, 0)
-    elif key[pygame.K_w]:
-        player_rect.move_ip(0, -1)
-    elif key[pygame.K_s]:
-        player_rect.move_ip(0, 1)
+    dx = key[pygame.K_d] - key[pygame.K_a]  # -1, 0 or 1 (diagonals allowed)
+    dy = key[pygame.K_s] - key[pygame.K_w]
+    pos_x += dx * speed * dt
+    pos_y += dy * speed * dt
+    player_rect.x = round(pos_x)
+    player_rect.y = round(pos_y)
     
-    for event in pygame.event.get():
+    for event in events:
         if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             run = False
 
@@ -1,14 +1,21 @@
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, K_ESCAPE  # Event constants used every frame
+
+# Movement per frame for each key, checked in priority order
+_DIRS = ((pygame.K_a, -1, 0), (pygame.K_d, 1, 0), (pygame.K_w, 0, -1), (pygame.K_s, 0, 1))
 
 pygame.init()
 pygame.display.set_caption("Display Rect Tick Example")
 clock = pygame.time.Clock()
-display = pygame.display.set_mode((800, 600)) # this is surface
-surface = pygame.Surface((500, 500))  # Create a new surface
+display = pygame.display.set_mode((800, 600), vsync=0)  # this is surface; clock.tick paces frames
+surface = pygame.Surface((500, 500)).convert()  # Create a new surface in the display format
 
 
 player_rect = pygame.Rect(100, 100, 50, 50)  # Example rectangle
 
+# Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s), False)
+
 run = True
 while run:
     
@@ -21,18 +28,20 @@ while run:
     display.blit(surface, (50, 50))  # Blit the surface onto the display at position (50, 50)
     
     
-    key = pygame.key.get_pressed()
-    if key[pygame.K_a]:
-        player_rect.move_ip(-1, 0)
-    elif key[pygame.K_d]:
-        player_rect.move_ip(1, 0)
-    elif key[pygame.K_w]:
-        player_rect.move_ip(0, -1)
-    elif key[pygame.K_s]:
-        player_rect.move_ip(0, 1)
+    dx = dy = 0
+    for k, mx, my in _DIRS:
+        if keys[k]:
+            dx, dy = mx, my
+            break
+    if dx or dy:
+        player_rect.move_ip(dx, dy)
     
     for event in pygame.event.get():
-        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+            keys[event.key] = event.type == KEYDOWN
+        elif event.type == WINDOWFOCUSLOST:
+            keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+        if event.type == QUIT or event.type == KEYDOWN and event.key == K_ESCAPE:
             run = False
 
     pygame.display.flip()  # Refresh the display
@@ -1,6 +1,10 @@
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, K_ESCAPE  # Event constants used every frame
 import os
 
+# Movement per frame for each key, checked in priority order
+_DIRS = ((pygame.K_a, -1, 0), (pygame.K_d, 1, 0), (pygame.K_w, 0, -1), (pygame.K_s, 0, 1))
+
 pygame.init()
 pygame.display.set_caption("Display Rect Tick Example")
 clock = pygame.time.Clock()
@@ -19,6 +23,9 @@ sprite = pygame.image.load(image_path)  # Load the image
 
 sprite_rect = sprite.get_rect(topleft=(100, 100))
 
+# Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s), False)
+
 run = True
 while run:
     
@@ -33,18 +40,20 @@ while run:
     display.blit(surface, (300, 300))  # Blit the surface onto the display at position (50, 50)
     
     
-    key = pygame.key.get_pressed()
-    if key[pygame.K_a]:
-        sprite_rect.move_ip(-1, 0)
-    elif key[pygame.K_d]:
-        sprite_rect.move_ip(1, 0)
-    elif key[pygame.K_w]:
-        sprite_rect.move_ip(0, -1)
-    elif key[pygame.K_s]:
-        sprite_rect.move_ip(0, 1)
+    dx = dy = 0
+    for k, mx, my in _DIRS:
+        if keys[k]:
+            dx, dy = mx, my
+            break
+    if dx or dy:
+        sprite_rect.move_ip(dx, dy)
     
     for event in pygame.event.get():
-        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+            keys[event.key] = event.type == KEYDOWN
+        elif event.type == WINDOWFOCUSLOST:
+            keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+        if event.type == QUIT or event.type == KEYDOWN and event.key == K_ESCAPE:
             run = False
 
     pygame.display.flip()  # Refresh the display
@@ -1,6 +1,10 @@
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, K_ESCAPE  # Event constants used every frame
 import os
 
+# Movement per frame for each key, checked in priority order
+_DIRS = ((pygame.K_a, -1, 0), (pygame.K_d, 1, 0), (pygame.K_w, 0, -1), (pygame.K_s, 0, 1))
+
 pygame.init()
 pygame.display.set_caption("Display Rect Tick Example")
 clock = pygame.time.Clock()
@@ -23,6 +27,9 @@ sprite2_rect = sprite2.get_rect(topleft=(200, 200))  # Another sprite rectangle
 
 holder_sprite_rect = sprite_rect  # To hold the current sprite rectangle for control
 
+# Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_q, pygame.K_e), False)
+
 run = True
 while run:
     
@@ -36,24 +43,26 @@ while run:
     display.blit(sprite2, sprite2_rect)  # Blit another sprite image onto the display
     
     # switch to control the first sprite
-    if pygame.key.get_pressed()[pygame.K_q]:
+    if keys[pygame.K_q]:
         holder_sprite_rect = sprite_rect
-    elif pygame.key.get_pressed()[pygame.K_e]:
+    elif keys[pygame.K_e]:
         holder_sprite_rect = sprite2_rect
         
     
-    key = pygame.key.get_pressed()
-    if key[pygame.K_a]:
-        holder_sprite_rect.move_ip(-1, 0)
-    elif key[pygame.K_d]:
-        holder_sprite_rect.move_ip(1, 0)
-    elif key[pygame.K_w]:
-        holder_sprite_rect.move_ip(0, -1)
-    elif key[pygame.K_s]:
-        holder_sprite_rect.move_ip(0, 1)
+    dx = dy = 0
+    for k, mx, my in _DIRS:
+        if keys[k]:
+            dx, dy = mx, my
+            break
+    if dx or dy:
+        holder_sprite_rect.move_ip(dx, dy)
     
     for event in pygame.event.get():
-        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+            keys[event.key] = event.type == KEYDOWN
+        elif event.type == WINDOWFOCUSLOST:
+            keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+        if event.type == QUIT or event.type == KEYDOWN and event.key == K_ESCAPE:
             run = False
 
     pygame.display.flip()  # Refresh the display
@@ -1,32 +1,74 @@
 import os
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, WINDOWEXPOSED  # Event constants used every frame
 import random
+from functools import partial
+
+
+# Movement per frame for each key, checked in priority order
+_DIRS = ((pygame.K_a, -1, 0), (pygame.K_d, 1, 0), (pygame.K_w, 0, -1), (pygame.K_s, 0, 1))
+
+# Loaded images keyed by path, shared by every Sprite using that file
+_IMAGE_CACHE = {}
+
+
+# Colour key for hard-edged sprites; only used when the art never contains it
+COLORKEY = (255, 0, 255)
+
+
+def colorkey_if_binary_alpha(image):
+    """Return a colour-keyed copy of image if its alpha is only ever 0 or 255"""
+    opaque = pygame.mask.from_surface(image, 254)
+    if pygame.mask.from_surface(image, 0).count() != opaque.count():
+        return image  # Soft edges need real alpha blending
+    keyed = pygame.Surface(image.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(image, (0, 0))
+    if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+        return image  # The art itself uses the key colour
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def load_image(image_path):
+    image = _IMAGE_CACHE.get(image_path)
+    if image is None:
+        # Convert to the display format once so blits skip per-pixel conversion
+        image = pygame.image.load(image_path)
+        if image.get_flags() & pygame.SRCALPHA or image.get_alpha() is not None:
+            image = colorkey_if_binary_alpha(image.convert_alpha())
+        else:
+            image = image.convert()
+        _IMAGE_CACHE[image_path] = image
+    return image
 
 
 class Sprite:
-    def __init__(self, image_path, position=(100, 100)):
-        self.image = pygame.image.load(image_path)
+    def __init__(self, image, position=(100, 100)):
+        # Accept an already loaded Surface or a path into the shared cache
+        self.image = image if isinstance(image, pygame.Surface) else load_image(image)
         self.rect = self.image.get_rect(topleft=position)
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
-
     def move(self, dx, dy):
-        new_rect = self.rect.copy()
-        new_rect.move_ip(dx, dy)
-        # Add boundary checking here
-        if 0 <= new_rect.x <= 800-new_rect.width:
-            self.rect.x = new_rect.x
-        if 0 <= new_rect.y <= 800-new_rect.height:
-            self.rect.y = new_rect.y
-            
+        # Check the candidate position as plain ints instead of a Rect copy
+        rect = self.rect
+        nx, ny = rect.x + dx, rect.y + dy
+        if 0 <= nx <= 800 - rect.width:
+            rect.x = nx
+        if 0 <= ny <= 800 - rect.height:
+            rect.y = ny
 
 
 def main():
     pygame.init()
     pygame.display.set_caption("Display Rect Tick Example")
     clock = pygame.time.Clock()
-    display = pygame.display.set_mode((800, 800))  # this is surface
+    display = pygame.display.set_mode((800, 800), vsync=0)  # this is surface; clock.tick paces frames
+    
+    # Only queue the events the loop handles, so MOUSEMOTION floods never reach Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                              pygame.WINDOWFOCUSLOST, pygame.WINDOWEXPOSED])
     
     
     CURRENT_DIR = os.path.dirname(__file__)  # -> /pygame/
@@ -50,44 +92,83 @@ def main():
     
     
 
+    # (image, rect) pairs for display.blits; rebuilt only when sprites change
+    blit_pairs = [(s.image, s.rect) for s in sprites]
+    
+    # Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+    keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s), False)
+
+    # KEYDOWN handlers, dispatched through keydown_actions
+    def quit_app():
+        nonlocal run
+        run = False
+    
+    def select_sprite(step):
+        nonlocal id_sprite, selected_sprite
+        dirty.append(selected_sprite.rect.copy())
+        id_sprite = (id_sprite + step) % len(sprites)
+        selected_sprite = sprites[id_sprite]
+        dirty.append(selected_sprite.rect.copy())
+    
+    keydown_actions = {
+        pygame.K_ESCAPE: quit_app,
+        pygame.K_q: partial(select_sprite, -1),
+        pygame.K_e: partial(select_sprite, 1),
+    }
+    
     run = True
+    full_redraw = True  # First frame presents the whole window
     while run:
-        display.fill((0, 0, 0))  # Clear the display with black background
+        dirty = []  # Rects changed this frame
         
-        dx, dy = 0, 0
-        key = pygame.key.get_pressed()
-        if key[pygame.K_a]:
-            dx, dy = -1, 0
-        elif key[pygame.K_d]:
-            dx, dy = 1, 0
-        elif key[pygame.K_w]:
-            dx, dy = 0, -1
-        elif key[pygame.K_s]:
-            dx, dy = 0, 1
+        dx = dy = 0
+        for k, mx, my in _DIRS:
+            if keys[k]:
+                dx, dy = mx, my
+                break
         
-        for sprite in sprites:
-            sprite.draw(display)
-            if sprite == selected_sprite:
-                # draw a rectangle around the selected sprite
-                pygame.draw.rect(display, (255, 255, 0), sprite.rect, 2)
-                if dx != 0 or dy != 0:
-                    sprite.move(dx, dy)
+        if selected_sprite and (dx or dy):
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite.move(dx, dy)
+            dirty.append(selected_sprite.rect.copy())
 
         for event in pygame.event.get():
-            if event.type == pygame.QUIT :
+            if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+                keys[event.key] = event.type == KEYDOWN
+            elif event.type == WINDOWFOCUSLOST:
+                keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+            if event.type == QUIT :
                 run = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    run = False
-                elif event.key == pygame.K_q and sprites:
-                    id_sprite = (id_sprite - 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
-                elif event.key == pygame.K_e and sprites:
-                    id_sprite = (id_sprite + 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
+            if event.type == KEYDOWN:
+                action = keydown_actions.get(event.key)
+                if action:
+                    action()
+            if event.type == WINDOWEXPOSED:
+                full_redraw = True
+
+        if dirty and not full_redraw:
+            # Redraw only the changed area; fall back to a full frame when it is large
+            area = dirty[0].unionall(dirty[1:])
+            if area.w * area.h > 0.5 * display.get_width() * display.get_height():
+                full_redraw = True
+            else:
+                display.set_clip(area)
+                
+        if dirty or full_redraw:
+            display.fill((0, 0, 0))  # Clear the display with black background
+            display.blits(blit_pairs, doreturn=False)
+            if selected_sprite:
+                # draw a rectangle around the selected sprite
+                pygame.draw.rect(display, (255, 255, 0), selected_sprite.rect, 2)
+            display.set_clip(None)
+            
+            if full_redraw:
+                pygame.display.flip()  # Refresh the display
+            else:
+                pygame.display.update(dirty)  # Refresh only what changed
+            full_redraw = False
 
         clock.tick(60)  # Limit the frame rate to 60 FPS
-        pygame.display.flip()  # Refresh the display
 
     pygame.quit()
     
@@ -1,24 +1,77 @@
 import os
 import pygame
+from pygame.locals import QUIT, KEYDOWN, WINDOWEXPOSED, K_ESCAPE, K_SPACE, K_a, K_d, K_w, K_s, K_q, K_e  # Constants used every frame
 import random
 
 
+# Loaded images keyed by path, shared by every Sprite using that file
+_IMAGE_CACHE = {}
+
+# Size of each cached image as a Rect at (0, 0); new sprites copy it with move()
+_RECT_CACHE = {}
+
+
+# Colour-key hard-edged sprites (explained in 07.class-based.py)
+COLORKEY = (255, 0, 255)
+
+
+def colorkey_if_binary_alpha(image):
+    opaque = pygame.mask.from_surface(image, 254)
+    if pygame.mask.from_surface(image, 0).count() != opaque.count():
+        return image
+    keyed = pygame.Surface(image.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(image, (0, 0))
+    if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+        return image
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def load_image(image_path):
+    image = _IMAGE_CACHE.get(image_path)
+    if image is None:
+        # Convert to the display format once so blits skip per-pixel conversion
+        image = pygame.image.load(image_path)
+        if image.get_flags() & pygame.SRCALPHA or image.get_alpha() is not None:
+            image = colorkey_if_binary_alpha(image.convert_alpha())
+        else:
+            image = image.convert()
+        _IMAGE_CACHE[image_path] = image
+    return image
+
+
+def load_image_and_rect(image_path):
+    image = load_image(image_path)
+    rect = _RECT_CACHE.get(image_path)
+    if rect is None:
+        rect = _RECT_CACHE[image_path] = image.get_rect()
+    return image, rect
+
+
 class Sprite:
-    def __init__(self, image_path, position=(100, 100)):
-        self.image = pygame.image.load(image_path)
-        self.rect = self.image.get_rect(topleft=position)
+    __slots__ = ('image', 'rect', '_max_x', '_max_y')
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def __init__(self, image, position=(100, 100)):
+        # Accept an already loaded Surface or a path into the shared cache
+        if isinstance(image, pygame.Surface):
+            self.image = image
+            self.rect = image.get_rect(topleft=position)
+        else:
+            self.image, proto = load_image_and_rect(image)
+            self.rect = proto.move(position)
+        # Largest position that keeps the sprite inside the 800x800 window
+        self._max_x = 800 - self.rect.width
+        self._max_y = 800 - self.rect.height
 
     def move(self, dx, dy):
-        new_rect = self.rect.copy()
-        new_rect.move_ip(dx, dy)
+        x = self.rect.x + dx
+        y = self.rect.y + dy
         # Add boundary checking here
-        if 0 <= new_rect.x <= 800-new_rect.width:
-            self.rect.x = new_rect.x
-        if 0 <= new_rect.y <= 800-new_rect.height:
-            self.rect.y = new_rect.y
+        if 0 <= x <= self._max_x:
+            self.rect.x = x
+        if 0 <= y <= self._max_y:
+            self.rect.y = y
             
 
 
@@ -28,6 +81,15 @@ def main():
     clock = pygame.time.Clock()
     display = pygame.display.set_mode((800, 800))  # this is surface
     
+    # Pre-rendered black background; blitted (clipped) instead of filling
+    background = pygame.Surface(display.get_size()).convert()
+    background.fill((0, 0, 0))
+    
+    # Only queue the events the loop handles, so MOUSEMOTION floods never reach Python
+    # (held movement keys are read with get_pressed, which does not need KEYUP events)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, KEYDOWN, WINDOWEXPOSED])
+    
     
     CURRENT_DIR = os.path.dirname(__file__)  # -> /pygame/
     BASE_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))  # -> / (project-root)
@@ -47,53 +109,95 @@ def main():
     if sprites:
         selected_sprite = sprites[id_sprite]
     
+    # (image, rect) pairs for blits; rects move in place so the pairs stay current
+    blit_pairs = [(s.image, s.rect) for s in sprites]
+    
     
     
 
+    # Bound once so the loop does local lookups instead of pygame.x.y attribute walks
+    get_pressed = pygame.key.get_pressed
+    event_get = pygame.event.get
+    randint = random.randint
+    draw_rect = pygame.draw.rect
+    flip = pygame.display.flip
+    update = pygame.display.update
+    tick = clock.tick
+    
     run = True
+    full_redraw = True  # First frame draws the whole window
     while run:
-        display.fill((0, 0, 0))  # Clear the display with black background
+        dirty = []  # Rects changed this frame
         
         dx, dy = 0, 0
-        key = pygame.key.get_pressed()
-        if key[pygame.K_a]:
+        key = get_pressed()
+        if key[K_a]:
             dx, dy = -1, 0
-        elif key[pygame.K_d]:
+        elif key[K_d]:
             dx, dy = 1, 0
-        elif key[pygame.K_w]:
+        elif key[K_w]:
             dx, dy = 0, -1
-        elif key[pygame.K_s]:
+        elif key[K_s]:
             dx, dy = 0, 1
         
-        for sprite in sprites:
-            sprite.draw(display)
-            if sprite == selected_sprite:
-                # draw a rectangle around the selected sprite
-                pygame.draw.rect(display, (255, 255, 0), sprite.rect, 2)
-                if dx != 0 or dy != 0:
-                    sprite.move(dx, dy)
+        if selected_sprite and (dx or dy):
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite.move(dx, dy)
+            dirty.append(selected_sprite.rect.copy())
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT :
+        for event in event_get():
+            if event.type == QUIT :
                 run = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+            if event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
                     run = False
-                elif event.key == pygame.K_q and sprites:
+                elif event.key == K_q and sprites:
+                    dirty.append(selected_sprite.rect.copy())
                     id_sprite = (id_sprite - 1) % len(sprites)
                     selected_sprite = sprites[id_sprite]
-                elif event.key == pygame.K_e and sprites:
+                    dirty.append(selected_sprite.rect.copy())
+                elif event.key == K_e and sprites:
+                    dirty.append(selected_sprite.rect.copy())
                     id_sprite = (id_sprite + 1) % len(sprites)
                     selected_sprite = sprites[id_sprite]
-                elif event.key == pygame.K_SPACE:
+                    dirty.append(selected_sprite.rect.copy())
+                elif event.key == K_SPACE:
                     # Add a new sprite at a random position
-                    position = (random.randint(0, 750), random.randint(0, 750))
+                    position = (randint(0, 750), randint(0, 750))
                     new_sprite = Sprite(image_path, position)
                     sprites.append(new_sprite)
+                    blit_pairs.append((new_sprite.image, new_sprite.rect))
+                    if selected_sprite:
+                        dirty.append(selected_sprite.rect.copy())
                     selected_sprite = new_sprite
+                    dirty.append(selected_sprite.rect.copy())
+            if event.type == WINDOWEXPOSED:
+                full_redraw = True
+
+        if dirty and not full_redraw:
+            # Redraw only the changed area; fall back to a full frame when it is large
+            area = dirty[0].unionall(dirty[1:])
+            if area.w * area.h > 0.5 * display.get_width() * display.get_height():
+                full_redraw = True
+            else:
+                display.set_clip(area)
+
+        if dirty or full_redraw:
+            display.blit(background, (0, 0))  # Clear the display with black background
+            # Draw every sprite in one call
+            display.blits(blit_pairs, doreturn=False)
+            if selected_sprite:
+                # draw a rectangle around the selected sprite
+                draw_rect(display, (255, 255, 0), selected_sprite.rect, 2)
+            display.set_clip(None)
+            
+            if full_redraw:
+                flip()  # Refresh the display
+            else:
+                update(dirty)  # Refresh only what changed
+            full_redraw = False
 
-        clock.tick(60)  # Limit the frame rate to 60 FPS
-        pygame.display.flip()  # Refresh the display
+        tick(60)  # Limit the frame rate to 60 FPS
 
     pygame.quit()
     
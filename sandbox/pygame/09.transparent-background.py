@@ -1,28 +1,72 @@
+import logging
 import os
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, WINDOWEXPOSED  # Event constants used every frame
 import random
+from functools import partial
 import win32gui
 import win32con
 import win32api
 
+# Per-keypress feedback; debug level so key spam never blocks on console output
+log = logging.getLogger(__name__)
+
+# Movement per frame for each key, checked in priority order; doubled for visibility
+_DIRS = ((pygame.K_a, -2, 0), (pygame.K_d, 2, 0), (pygame.K_w, 0, -2), (pygame.K_s, 0, 2))
+
+# Loaded images keyed by path, shared by every Sprite using that file
+_IMAGE_CACHE = {}
+
+
+# Colour-key hard-edged sprites (explained in 07.class-based.py)
+COLORKEY = (255, 0, 255)
+
+
+def colorkey_if_binary_alpha(image):
+    opaque = pygame.mask.from_surface(image, 254)
+    if pygame.mask.from_surface(image, 0).count() != opaque.count():
+        return image
+    keyed = pygame.Surface(image.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(image, (0, 0))
+    if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+        return image
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def load_image(image_path):
+    image = _IMAGE_CACHE.get(image_path)
+    if image is None:
+        # Convert to the display format once so blits skip per-pixel conversion
+        image = pygame.image.load(image_path)
+        if image.get_flags() & pygame.SRCALPHA or image.get_alpha() is not None:
+            image = colorkey_if_binary_alpha(image.convert_alpha())
+        else:
+            image = image.convert()
+        _IMAGE_CACHE[image_path] = image
+    return image
+
+
 class Sprite:
-    def __init__(self, image_path, position=(100, 100)):
-        self.image = pygame.image.load(image_path)
-        self.rect = self.image.get_rect(topleft=position)
+    # Display size, filled in once the window exists
+    screen_w = screen_h = 0
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def __init__(self, image, position=(100, 100)):
+        # Accept an already loaded Surface or a path into the shared cache
+        self.image = image if isinstance(image, pygame.Surface) else load_image(image)
+        self.rect = self.image.get_rect(topleft=position)
 
     def move(self, dx, dy):
-        new_rect = self.rect.copy()
-        new_rect.move_ip(dx, dy)
-        # Add boundary checking here
-        screen_width = pygame.display.get_surface().get_width()
-        screen_height = pygame.display.get_surface().get_height()
-        if 0 <= new_rect.x <= screen_width-new_rect.width:
-            self.rect.x = new_rect.x
-        if 0 <= new_rect.y <= screen_height-new_rect.height:
-            self.rect.y = new_rect.y
+        # Check the candidate position as plain ints instead of a Rect copy
+        rect = self.rect
+        nx, ny = rect.x + dx, rect.y + dy
+        screen_width = Sprite.screen_w
+        screen_height = Sprite.screen_h
+        if 0 <= nx <= screen_width - rect.width:
+            rect.x = nx
+        if 0 <= ny <= screen_height - rect.height:
+            rect.y = ny
 
 def create_transparent_pygame_window():
     """
@@ -36,8 +80,9 @@ def create_transparent_pygame_window():
     screen_height = win32api.GetSystemMetrics(1)
     
     # Buat pygame window (borderless)
-    display = pygame.display.set_mode((screen_width, screen_height), pygame.NOFRAME)
+    display = pygame.display.set_mode((screen_width, screen_height), pygame.NOFRAME, vsync=0)  # clock.tick paces frames
     pygame.display.set_caption("Desktop Pet")
+    Sprite.screen_w, Sprite.screen_h = screen_width, screen_height
     
     # Dapatkan handle window pygame
     hwnd = pygame.display.get_wm_info()["window"]
@@ -79,6 +124,11 @@ def main():
     # Create transparent window (FIXED VERSION)
     display, hwnd, screen_width, screen_height = create_transparent_pygame_window()
     
+    # Only queue the events the loop handles, so MOUSEMOTION floods never reach Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                              pygame.WINDOWFOCUSLOST, pygame.WINDOWEXPOSED])
+    
     # Load sprite
     CURRENT_DIR = os.path.dirname(__file__)
     BASE_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
@@ -125,63 +175,109 @@ def main():
     print("  SPACE: Add new sprite")
     print("  ESC: Exit")
     
+    # (image, rect) pairs for display.blits; rebuilt only when sprites change
+    blit_pairs = [(s.image, s.rect) for s in sprites]
+    
+    # Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+    keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s), False)
+    
+    # KEYDOWN handlers, dispatched through keydown_actions
+    def quit_app():
+        nonlocal run
+        run = False
+    
+    def select_sprite(step):
+        nonlocal id_sprite, selected_sprite
+        dirty.append(selected_sprite.rect.copy())
+        id_sprite = (id_sprite + step) % len(sprites)
+        selected_sprite = sprites[id_sprite]
+        dirty.append(selected_sprite.rect.copy())
+        log.debug("Selected sprite #%d", id_sprite)
+    
+    def spawn_sprite():
+        nonlocal id_sprite, selected_sprite
+        # Add new sprite at random position
+        position = (random.randint(100, screen_width-150), 
+                   random.randint(100, screen_height-150))
+        try:
+            new_sprite = Sprite(image_path, position)
+            sprites.append(new_sprite)
+            blit_pairs.append((new_sprite.image, new_sprite.rect))
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite = new_sprite
+            id_sprite = len(sprites) - 1
+            dirty.append(selected_sprite.rect.copy())
+            log.debug("Added sprite #%d", len(sprites))
+        except pygame.error as e:
+            print(f"Error adding sprite: {e}")
+    
+    keydown_actions = {
+        pygame.K_ESCAPE: quit_app,
+        pygame.K_q: partial(select_sprite, -1),
+        pygame.K_e: partial(select_sprite, 1),
+        pygame.K_SPACE: spawn_sprite,
+    }
+    
     # Main game loop
     run = True
+    full_redraw = True  # First frame presents the whole window
     while run:
-        # IMPORTANT: Fill with BLACK (will be transparent)
-        display.fill((0, 0, 0))  # Black background = transparent!
+        dirty = []  # Rects changed this frame
         
         # Handle movement
-        dx, dy = 0, 0
-        key = pygame.key.get_pressed()
-        if key[pygame.K_a]:
-            dx, dy = -2, 0  # Increased speed for visibility
-        elif key[pygame.K_d]:
-            dx, dy = 2, 0
-        elif key[pygame.K_w]:
-            dx, dy = 0, -2
-        elif key[pygame.K_s]:
-            dx, dy = 0, 2
+        dx = dy = 0
+        for k, mx, my in _DIRS:
+            if keys[k]:
+                dx, dy = mx, my
+                break
         
-        # Draw and move sprites
-        for sprite in sprites:
-            sprite.draw(display)
-            if sprite == selected_sprite:
-                # Draw selection indicator (yellow border)
-                pygame.draw.rect(display, (255, 255, 0), sprite.rect, 3)
-                if dx != 0 or dy != 0:
-                    sprite.move(dx, dy)
+        # Move the selected sprite, remembering where it was and where it went
+        if dx or dy:
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite.move(dx, dy)
+            dirty.append(selected_sprite.rect.copy())
         
         # Handle events
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+                keys[event.key] = event.type == KEYDOWN
+            elif event.type == WINDOWFOCUSLOST:
+                keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+            if event.type == QUIT:
                 run = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    run = False
-                elif event.key == pygame.K_q and sprites:
-                    id_sprite = (id_sprite - 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
-                    print(f"Selected sprite #{id_sprite}")
-                elif event.key == pygame.K_e and sprites:
-                    id_sprite = (id_sprite + 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
-                    print(f"Selected sprite #{id_sprite}")
-                elif event.key == pygame.K_SPACE:
-                    # Add new sprite at random position
-                    position = (random.randint(100, screen_width-150), 
-                               random.randint(100, screen_height-150))
-                    try:
-                        new_sprite = Sprite(image_path, position)
-                        sprites.append(new_sprite)
-                        selected_sprite = new_sprite
-                        id_sprite = len(sprites) - 1
-                        print(f"Added sprite #{len(sprites)}")
-                    except pygame.error as e:
-                        print(f"Error adding sprite: {e}")
+            if event.type == KEYDOWN:
+                action = keydown_actions.get(event.key)
+                if action:
+                    action()
+            if event.type == WINDOWEXPOSED:
+                full_redraw = True
+
+        if dirty and not full_redraw:
+            # Redraw only the changed area; fall back to a full frame when it is large
+            area = dirty[0].unionall(dirty[1:])
+            if area.w * area.h > 0.5 * screen_width * screen_height:
+                full_redraw = True
+            else:
+                display.set_clip(area)
+        
+        if dirty or full_redraw:
+            # IMPORTANT: Fill with BLACK (will be transparent)
+            display.fill((0, 0, 0))  # Black background = transparent!
+            
+            # Draw every sprite in one call
+            display.blits(blit_pairs, doreturn=False)
+            
+            # Draw selection indicator (yellow border)
+            pygame.draw.rect(display, (255, 255, 0), selected_sprite.rect, 3)
+            display.set_clip(None)
+            
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)  # Present only what changed
+            full_redraw = False
 
         clock.tick(60)  # 60 FPS
-        pygame.display.flip()
 
     print("\n🏁 Desktop Pet closed")
     pygame.quit()
@@ -1,76 +1,119 @@
+import logging
 import os
 import pygame
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWFOCUSLOST, WINDOWEXPOSED  # Event constants used every frame
 import random
+from functools import partial
+from collections import namedtuple
 import win32gui
 import win32con
 import win32api
 
+# Per-keypress feedback; debug level so key spam never blocks on console output
+log = logging.getLogger(__name__)
+
+# Movement per frame for each key, checked in priority order; doubled for visibility
+_DIRS = ((pygame.K_a, -2, 0), (pygame.K_d, 2, 0), (pygame.K_w, 0, -2), (pygame.K_s, 0, 2))
+
+# Boundary positions in screen pixels; attribute access instead of dict lookups
+Boundaries = namedtuple('Boundaries', 'left_wall right_wall ceiling floor')
+
+# Loaded images keyed by path, shared by every Sprite using that file
+_IMAGE_CACHE = {}
+
+
+# Colour-key hard-edged sprites (explained in 07.class-based.py)
+COLORKEY = (255, 0, 255)
+
+
+def colorkey_if_binary_alpha(image):
+    opaque = pygame.mask.from_surface(image, 254)
+    if pygame.mask.from_surface(image, 0).count() != opaque.count():
+        return image
+    keyed = pygame.Surface(image.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(image, (0, 0))
+    if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+        return image
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def load_image(image_path):
+    image = _IMAGE_CACHE.get(image_path)
+    if image is None:
+        # Convert to the display format once so blits skip per-pixel conversion
+        image = pygame.image.load(image_path)
+        if image.get_flags() & pygame.SRCALPHA or image.get_alpha() is not None:
+            image = colorkey_if_binary_alpha(image.convert_alpha())
+        else:
+            image = image.convert()
+        _IMAGE_CACHE[image_path] = image
+    return image
+
+
 class Sprite:
-    def __init__(self, image_path, position=(100, 100)):
-        self.image = pygame.image.load(image_path)
-        self.rect = self.image.get_rect(topleft=position)
+    # Display size, filled in once the window exists
+    screen_w = screen_h = 0
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def __init__(self, image, position=(100, 100)):
+        # Accept an already loaded Surface or a path into the shared cache
+        self.image = image if isinstance(image, pygame.Surface) else load_image(image)
+        self.rect = self.image.get_rect(topleft=position)
 
     def move(self, dx, dy, boundaries=None):
-        new_rect = self.rect.copy()
-        new_rect.move_ip(dx, dy)
+        # Work on plain ints and update the rect in place, so the rect
+        # shared with blit_pairs stays current and no Rect copy is made
+        rect = self.rect
+        nx, ny = rect.x + dx, rect.y + dy
         
         if boundaries:
-            # Check artificial boundaries
-            if new_rect.left < boundaries['left_wall']:
-                new_rect.left = boundaries['left_wall']
-            if new_rect.right > boundaries['right_wall']:
-                new_rect.right = boundaries['right_wall']
-            if new_rect.top < boundaries['ceiling']:
-                new_rect.top = boundaries['ceiling']
-            if new_rect.bottom > boundaries['floor']:
-                new_rect.bottom = boundaries['floor']
+            # Clamp to artificial boundaries
+            rect.x = max(boundaries.left_wall, min(nx, boundaries.right_wall - rect.width))
+            rect.y = max(boundaries.ceiling, min(ny, boundaries.floor - rect.height))
         else:
             # Original boundary checking
-            screen_width = pygame.display.get_surface().get_width()
-            screen_height = pygame.display.get_surface().get_height()
-            if 0 <= new_rect.x <= screen_width-new_rect.width:
-                new_rect.x = new_rect.x
-            if 0 <= new_rect.y <= screen_height-new_rect.height:
-                new_rect.y = new_rect.y
-        
-        self.rect = new_rect
+            screen_width = Sprite.screen_w
+            screen_height = Sprite.screen_h
+            if 0 <= nx <= screen_width - rect.width:
+                rect.x = nx
+            if 0 <= ny <= screen_height - rect.height:
+                rect.y = ny
 
 def calculate_boundaries(screen_width, screen_height):
     """Calculate boundary positions"""
-    return {
-        'left_wall': int(screen_width * 0.1),      # 10% from left
-        'right_wall': int(screen_width * 0.9),     # 90% from left  
-        'ceiling': int(screen_height * 0.1),       # 10% from top
-        'floor': int(screen_height * 0.9)          # 90% from top
-    }
+    return Boundaries(
+        left_wall=int(screen_width * 0.1),      # 10% from left
+        right_wall=int(screen_width * 0.9),     # 90% from left  
+        ceiling=int(screen_height * 0.1),       # 10% from top
+        floor=int(screen_height * 0.9)          # 90% from top
+    )
 
 def draw_boundaries(display, boundaries):
     """Draw artificial boundaries"""
     screen_width = display.get_width()
     screen_height = display.get_height()
+    left_wall, right_wall, ceiling, floor = boundaries
     
     # Left wall (biru)
     pygame.draw.line(display, (0, 0, 255), 
-                    (boundaries['left_wall'], 0), 
-                    (boundaries['left_wall'], screen_height), 3)
+                    (left_wall, 0), 
+                    (left_wall, screen_height), 3)
     
     # Right wall (biru)  
     pygame.draw.line(display, (0, 0, 255),
-                    (boundaries['right_wall'], 0),
-                    (boundaries['right_wall'], screen_height), 3)
+                    (right_wall, 0),
+                    (right_wall, screen_height), 3)
     
     # Ceiling (kuning)
     pygame.draw.line(display, (255, 255, 0),
-                    (0, boundaries['ceiling']),
-                    (screen_width, boundaries['ceiling']), 3)
+                    (0, ceiling),
+                    (screen_width, ceiling), 3)
     
     # Floor (hijau)
     pygame.draw.line(display, (0, 255, 0),
-                    (0, boundaries['floor']),
-                    (screen_width, boundaries['floor']), 3)
+                    (0, floor),
+                    (screen_width, floor), 3)
 
 def create_transparent_pygame_window():
     """
@@ -84,8 +127,9 @@ def create_transparent_pygame_window():
     screen_height = win32api.GetSystemMetrics(1)
     
     # Buat pygame window (borderless)
-    display = pygame.display.set_mode((screen_width, screen_height), pygame.NOFRAME)
+    display = pygame.display.set_mode((screen_width, screen_height), pygame.NOFRAME, vsync=0)  # clock.tick paces frames
     pygame.display.set_caption("Desktop Pet with Boundaries")
+    Sprite.screen_w, Sprite.screen_h = screen_width, screen_height
     
     # Dapatkan handle window pygame
     hwnd = pygame.display.get_wm_info()["window"]
@@ -127,14 +171,24 @@ def main():
     # Create transparent window (FIXED VERSION)
     display, hwnd, screen_width, screen_height = create_transparent_pygame_window()
     
+    # Only queue the events the loop handles, so MOUSEMOTION floods never reach Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                              pygame.WINDOWFOCUSLOST, pygame.WINDOWEXPOSED])
+    
     # Calculate boundaries
     boundaries = calculate_boundaries(screen_width, screen_height)
-    print(f"✅ Boundaries: Left={boundaries['left_wall']}, Right={boundaries['right_wall']}")
-    print(f"✅ Boundaries: Ceiling={boundaries['ceiling']}, Floor={boundaries['floor']}")
+    print(f"✅ Boundaries: Left={boundaries.left_wall}, Right={boundaries.right_wall}")
+    print(f"✅ Boundaries: Ceiling={boundaries.ceiling}, Floor={boundaries.floor}")
     
     # Boundary visibility toggle
     show_boundaries = True
     
+    # Boundaries are static: rasterize them once onto the black background
+    boundary_background = pygame.Surface((screen_width, screen_height)).convert()
+    boundary_background.fill((0, 0, 0))
+    draw_boundaries(boundary_background, boundaries)
+    
     # Load sprite
     CURRENT_DIR = os.path.dirname(__file__)
     BASE_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
@@ -160,8 +214,8 @@ def main():
     # Create 3 sprites (reduced for testing)
     for i in range(3):
         # Spawn within boundaries
-        position = (random.randint(boundaries['left_wall'] + 10, boundaries['right_wall'] - 74), 
-                   random.randint(boundaries['ceiling'] + 10, boundaries['floor'] - 74))
+        position = (random.randint(boundaries.left_wall + 10, boundaries.right_wall - 74), 
+                   random.randint(boundaries.ceiling + 10, boundaries.floor - 74))
         try:
             sprite = Sprite(image_path, position)
             sprites.append(sprite)
@@ -187,71 +241,120 @@ def main():
     print("  🟡 Yellow line: Ceiling (top)")
     print("  🟢 Green line: Floor (bottom)")
     
+    # (image, rect) pairs for display.blits; rebuilt only when sprites change
+    blit_pairs = [(s.image, s.rect) for s in sprites]
+    
+    # Held keys, updated from KEYDOWN/KEYUP instead of polling every frame
+    keys = dict.fromkeys((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s), False)
+    
+    # KEYDOWN handlers, dispatched through keydown_actions
+    def quit_app():
+        nonlocal run
+        run = False
+    
+    def select_sprite(step):
+        nonlocal id_sprite, selected_sprite
+        dirty.append(selected_sprite.rect.copy())
+        id_sprite = (id_sprite + step) % len(sprites)
+        selected_sprite = sprites[id_sprite]
+        dirty.append(selected_sprite.rect.copy())
+        log.debug("Selected sprite #%d", id_sprite)
+    
+    def toggle_boundaries():
+        # Toggle boundaries visibility
+        nonlocal show_boundaries, full_redraw
+        show_boundaries = not show_boundaries
+        full_redraw = True
+        log.debug("Boundaries: %s", 'ON' if show_boundaries else 'OFF')
+    
+    def spawn_sprite():
+        nonlocal id_sprite, selected_sprite
+        # Add new sprite at random position within boundaries
+        position = (random.randint(boundaries.left_wall + 10, boundaries.right_wall - 74), 
+                   random.randint(boundaries.ceiling + 10, boundaries.floor - 74))
+        try:
+            new_sprite = Sprite(image_path, position)
+            sprites.append(new_sprite)
+            blit_pairs.append((new_sprite.image, new_sprite.rect))
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite = new_sprite
+            id_sprite = len(sprites) - 1
+            dirty.append(selected_sprite.rect.copy())
+            log.debug("Added sprite #%d within boundaries", len(sprites))
+        except pygame.error as e:
+            print(f"Error adding sprite: {e}")
+    
+    keydown_actions = {
+        pygame.K_ESCAPE: quit_app,
+        pygame.K_q: partial(select_sprite, -1),
+        pygame.K_e: partial(select_sprite, 1),
+        pygame.K_b: toggle_boundaries,
+        pygame.K_SPACE: spawn_sprite,
+    }
+    
     # Main game loop
     run = True
+    full_redraw = True  # First frame presents the whole window
     while run:
-        # IMPORTANT: Fill with BLACK (will be transparent)
-        display.fill((0, 0, 0))  # Black background = transparent!
-        
-        # Draw boundaries (conditional)
-        if show_boundaries:
-            draw_boundaries(display, boundaries)
+        dirty = []  # Rects changed this frame
         
         # Handle movement
-        dx, dy = 0, 0
-        key = pygame.key.get_pressed()
-        if key[pygame.K_a]:
-            dx, dy = -2, 0  # Increased speed for visibility
-        elif key[pygame.K_d]:
-            dx, dy = 2, 0
-        elif key[pygame.K_w]:
-            dx, dy = 0, -2
-        elif key[pygame.K_s]:
-            dx, dy = 0, 2
+        dx = dy = 0
+        for k, mx, my in _DIRS:
+            if keys[k]:
+                dx, dy = mx, my
+                break
         
-        # Draw and move sprites
-        for sprite in sprites:
-            sprite.draw(display)
-            if sprite == selected_sprite:
-                # Draw selection indicator (yellow border)
-                pygame.draw.rect(display, (255, 255, 0), sprite.rect, 3)
-                if dx != 0 or dy != 0:
-                    sprite.move(dx, dy, boundaries)  # Use boundaries
+        # Move the selected sprite, remembering where it was and where it went
+        if dx or dy:
+            dirty.append(selected_sprite.rect.copy())
+            selected_sprite.move(dx, dy, boundaries)  # Use boundaries
+            dirty.append(selected_sprite.rect.copy())
         
         # Handle events
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type in (KEYDOWN, KEYUP) and event.key in keys:
+                keys[event.key] = event.type == KEYDOWN
+            elif event.type == WINDOWFOCUSLOST:
+                keys = dict.fromkeys(keys, False)  # KEYUPs are not delivered while unfocused
+            if event.type == QUIT:
                 run = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    run = False
-                elif event.key == pygame.K_q and sprites:
-                    id_sprite = (id_sprite - 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
-                    print(f"Selected sprite #{id_sprite}")
-                elif event.key == pygame.K_e and sprites:
-                    id_sprite = (id_sprite + 1) % len(sprites)
-                    selected_sprite = sprites[id_sprite]
-                    print(f"Selected sprite #{id_sprite}")
-                elif event.key == pygame.K_b:
-                    # Toggle boundaries visibility
-                    show_boundaries = not show_boundaries
-                    print(f"Boundaries: {'ON' if show_boundaries else 'OFF'}")
-                elif event.key == pygame.K_SPACE:
-                    # Add new sprite at random position within boundaries
-                    position = (random.randint(boundaries['left_wall'] + 10, boundaries['right_wall'] - 74), 
-                               random.randint(boundaries['ceiling'] + 10, boundaries['floor'] - 74))
-                    try:
-                        new_sprite = Sprite(image_path, position)
-                        sprites.append(new_sprite)
-                        selected_sprite = new_sprite
-                        id_sprite = len(sprites) - 1
-                        print(f"Added sprite #{len(sprites)} within boundaries")
-                    except pygame.error as e:
-                        print(f"Error adding sprite: {e}")
+            if event.type == KEYDOWN:
+                action = keydown_actions.get(event.key)
+                if action:
+                    action()
+            if event.type == WINDOWEXPOSED:
+                full_redraw = True
+
+        if dirty and not full_redraw:
+            # Redraw only the changed area; fall back to a full frame when it is large
+            area = dirty[0].unionall(dirty[1:])
+            if area.w * area.h > 0.5 * screen_width * screen_height:
+                full_redraw = True
+            else:
+                display.set_clip(area)
+        
+        if dirty or full_redraw:
+            # IMPORTANT: Background is BLACK (will be transparent)
+            if show_boundaries:
+                display.blit(boundary_background, (0, 0))  # Black + pre-drawn boundaries
+            else:
+                display.fill((0, 0, 0))  # Black background = transparent!
+            
+            # Draw every sprite in one call
+            display.blits(blit_pairs, doreturn=False)
+            
+            # Draw selection indicator (yellow border)
+            pygame.draw.rect(display, (255, 255, 0), selected_sprite.rect, 3)
+            display.set_clip(None)
+            
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)  # Present only what changed
+            full_redraw = False
 
         clock.tick(60)  # 60 FPS
-        pygame.display.flip()
 
     print("\n🏁 Desktop Pet with Boundaries closed")
     pygame.quit()
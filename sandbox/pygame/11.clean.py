@@ -17,24 +17,23 @@ except ImportError:
 class MonitorManager:
     """Handles multi-monitor detection and main monitor positioning"""
     
+    _cached_main = None  # Primary monitor info, queried once
+    
     @staticmethod
     def get_main_monitor_info():
         """Get main monitor dimensions and position"""
-        if WIN32_AVAILABLE:
-            return MonitorManager._get_main_monitor_win32()
-        else:
-            return MonitorManager._get_main_monitor_pygame()
+        if MonitorManager._cached_main is None:
+            if WIN32_AVAILABLE:
+                MonitorManager._cached_main = MonitorManager._get_main_monitor_win32()
+            else:
+                MonitorManager._cached_main = MonitorManager._get_main_monitor_pygame()
+        return MonitorManager._cached_main
     
     @staticmethod
     def _get_main_monitor_win32():
         """Get main monitor info using Win32 API"""
         try:
-            # Get primary monitor handle
-            primary_monitor = win32api.GetSystemMetrics(win32con.SM_CXSCREEN), \
-                            win32api.GetSystemMetrics(win32con.SM_CYSCREEN)
-            
             # Get monitor info for primary display
-            hdc = win32gui.GetDC(0)
             monitor_info = {
                 'width': win32api.GetSystemMetrics(win32con.SM_CXSCREEN),
                 'height': win32api.GetSystemMetrics(win32con.SM_CYSCREEN),
@@ -42,7 +41,6 @@ class MonitorManager:
                 'y': 0,
                 'is_primary': True
             }
-            win32gui.ReleaseDC(0, hdc)
             
             print(f"🖥️ Main monitor: {monitor_info['width']}x{monitor_info['height']} at ({monitor_info['x']}, {monitor_info['y']})")
             return monitor_info
@@ -122,37 +120,67 @@ class MonitorManager:
             print(f"⚠️ Monitor enumeration failed: {e}")
             return [MonitorManager.get_main_monitor_info()]
 
+# ========== IMAGE CACHE (LOAD ONCE, SHARE BETWEEN SPRITES) ==========
+_IMAGE_CACHE = {}
+
+def load_image(image_path):
+    """Load an image once per path; every sprite shares the same Surface"""
+    image = _IMAGE_CACHE.get(image_path)
+    if image is None:
+        try:
+            image = pygame.image.load(image_path)
+        except pygame.error as e:
+            print(f"⚠️ Could not load image {image_path}: {e}")
+            # Create fallback red square
+            image = pygame.Surface((64, 64))
+            image.fill((255, 0, 0))
+        
+        # Match the display format once so every blit takes the fast path
+        # (needs the window, which initialize() creates before any sprite)
+        if image.get_flags() & pygame.SRCALPHA or image.get_alpha() is not None:
+            image = image.convert_alpha()
+        else:
+            image = image.convert()
+        _IMAGE_CACHE[image_path] = image
+    return image
+
 # ========== PURE SPRITE CLASS (SINGLE RESPONSIBILITY) ==========
 class Sprite:
     """Pure sprite - only handles image and position data"""
     
+    __slots__ = ('image', 'x', 'y', 'width', 'height', '_rect')
+    
     def __init__(self, image_path, x=0, y=0):
-        try:
-            self.image = pygame.image.load(image_path)
-        except pygame.error as e:
-            print(f"⚠️ Could not load image {image_path}: {e}")
-            # Create fallback red square
-            self.image = pygame.Surface((64, 64))
-            self.image.fill((255, 0, 0))
+        self.image = load_image(image_path)
         
         self.x = x
         self.y = y
         self.width = self.image.get_width()
         self.height = self.image.get_height()
+        self._rect = pygame.Rect(x, y, self.width, self.height)
     
     def get_rect(self):
-        """Get pygame rect for collision detection"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get pygame rect for collision detection (shared, do not modify)"""
+        return self._rect
     
     def set_position(self, x, y):
         """Set sprite position"""
         self.x = x
         self.y = y
+        self._rect.x = x
+        self._rect.y = y
     
     def get_position(self):
         """Get sprite position"""
         return (self.x, self.y)
     
+    def set_image(self, image):
+        """Swap sprite image, keeping position"""
+        self.image = image
+        self.width = image.get_width()
+        self.height = image.get_height()
+        self._rect.size = (self.width, self.height)
+    
     def draw(self, surface):
         """Draw sprite to surface"""
         surface.blit(self.image, (self.x, self.y))
@@ -161,102 +189,111 @@ class Sprite:
 class BoundaryManager:
     """Handles all boundary-related logic"""
     
+    __slots__ = ('screen_width', 'screen_height',
+                 'left_wall', 'right_wall', 'ceiling', 'floor', '_lines')
+    
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.boundaries = self._calculate_boundaries()
+        self._calculate_boundaries()
     
     def _calculate_boundaries(self):
-        """Calculate boundary positions"""
-        return {
-            'left_wall': int(self.screen_width * 0.1),
-            'right_wall': int(self.screen_width * 0.9),
-            'ceiling': int(self.screen_height * 0.1),
-            'floor': int(self.screen_height * 0.9)
-        }
+        """Calculate boundary positions as plain attributes"""
+        self.left_wall = int(self.screen_width * 0.1)
+        self.right_wall = int(self.screen_width * 0.9)
+        self.ceiling = int(self.screen_height * 0.1)
+        self.floor = int(self.screen_height * 0.9)
+        
+        # Boundary lines as (color, start, end), built once for draw_boundaries
+        self._lines = (
+            ((0, 0, 255), (self.left_wall, 0), (self.left_wall, self.screen_height)),     # Left wall
+            ((0, 0, 255), (self.right_wall, 0), (self.right_wall, self.screen_height)),   # Right wall
+            ((255, 255, 0), (0, self.ceiling), (self.screen_width, self.ceiling)),        # Ceiling
+            ((0, 255, 0), (0, self.floor), (self.screen_width, self.floor))               # Floor
+        )
     
     def check_collision(self, sprite):
         """Check if sprite collides with boundaries"""
         rect = sprite.get_rect()
         collisions = {
-            'left': rect.left < self.boundaries['left_wall'],
-            'right': rect.right > self.boundaries['right_wall'],
-            'top': rect.top < self.boundaries['ceiling'],
-            'bottom': rect.bottom > self.boundaries['floor']
+            'left': rect.left < self.left_wall,
+            'right': rect.right > self.right_wall,
+            'top': rect.top < self.ceiling,
+            'bottom': rect.bottom > self.floor
         }
         return collisions
     
     def clamp_position(self, sprite):
         """Clamp sprite position to boundaries"""
         x, y = sprite.get_position()
-        
-        # Clamp X
-        if x < self.boundaries['left_wall']:
-            x = self.boundaries['left_wall']
-        elif x + sprite.width > self.boundaries['right_wall']:
-            x = self.boundaries['right_wall'] - sprite.width
-        
-        # Clamp Y
-        if y < self.boundaries['ceiling']:
-            y = self.boundaries['ceiling']
-        elif y + sprite.height > self.boundaries['floor']:
-            y = self.boundaries['floor'] - sprite.height
-        
+        x = min(max(x, self.left_wall), self.right_wall - sprite.width)
+        y = min(max(y, self.ceiling), self.floor - sprite.height)
         sprite.set_position(x, y)
     
     def get_safe_spawn_position(self, sprite_width, sprite_height):
         """Get random position within boundaries"""
         x = random.randint(
-            self.boundaries['left_wall'] + 10,
-            max(self.boundaries['left_wall'] + 11, self.boundaries['right_wall'] - sprite_width - 10)
+            self.left_wall + 10,
+            max(self.left_wall + 11, self.right_wall - sprite_width - 10)
         )
         y = random.randint(
-            self.boundaries['ceiling'] + 10,
-            max(self.boundaries['ceiling'] + 11, self.boundaries['floor'] - sprite_height - 10)
+            self.ceiling + 10,
+            max(self.ceiling + 11, self.floor - sprite_height - 10)
         )
         return (x, y)
     
     def draw_boundaries(self, surface):
         """Draw boundary lines"""
-        # Left wall (blue)
-        pygame.draw.line(surface, (0, 0, 255),
-                        (self.boundaries['left_wall'], 0),
-                        (self.boundaries['left_wall'], self.screen_height), 3)
-        
-        # Right wall (blue)
-        pygame.draw.line(surface, (0, 0, 255),
-                        (self.boundaries['right_wall'], 0),
-                        (self.boundaries['right_wall'], self.screen_height), 3)
-        
-        # Ceiling (yellow)
-        pygame.draw.line(surface, (255, 255, 0),
-                        (0, self.boundaries['ceiling']),
-                        (self.screen_width, self.boundaries['ceiling']), 3)
-        
-        # Floor (green)
-        pygame.draw.line(surface, (0, 255, 0),
-                        (0, self.boundaries['floor']),
-                        (self.screen_width, self.boundaries['floor']), 3)
+        draw_line = pygame.draw.line
+        for color, start, end in self._lines:
+            draw_line(surface, color, start, end, 3)
 
 # ========== MOVEMENT CONTROLLER (SINGLE RESPONSIBILITY) ==========
 class MovementController:
     """Handles movement input and position calculation"""
     
+    __slots__ = ('_speed', '_moves')
+    
+    # One bit per movement key, so each key is tracked independently
+    KEY_BITS = {
+        pygame.K_a: 1, pygame.K_LEFT: 2,
+        pygame.K_d: 4, pygame.K_RIGHT: 8,
+        pygame.K_w: 16, pygame.K_UP: 32,
+        pygame.K_s: 64, pygame.K_DOWN: 128
+    }
+    LEFT, RIGHT, UP, DOWN = 1 | 2, 4 | 8, 16 | 32, 64 | 128
+    
     def __init__(self, speed=2):
         self.speed = speed
     
+    @property
+    def speed(self):
+        return self._speed
+    
+    @speed.setter
+    def speed(self, value):
+        self._speed = value
+        # Movement for every possible key mask, so per-frame input is a single lookup;
+        # rebuilt here so the table never goes stale when speed changes
+        self._moves = tuple(self._compute_movement(keys)
+                            for keys in range(1 << len(self.KEY_BITS)))
+    
     def get_movement_from_input(self, keys):
-        """Calculate movement vector from keyboard input"""
+        """Get movement vector for a KEY_BITS bitmask of held keys"""
+        return self._moves[keys]
+    
+    def _compute_movement(self, keys):
+        """Calculate movement vector from a KEY_BITS bitmask of held keys"""
         dx, dy = 0, 0
         
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        if keys & self.LEFT:
             dx = -self.speed
-        elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        elif keys & self.RIGHT:
             dx = self.speed
         
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
+        if keys & self.UP:
             dy = -self.speed
-        elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        elif keys & self.DOWN:
             dy = self.speed
         
         return (dx, dy)
@@ -272,19 +309,32 @@ class MovementController:
 class SpriteManager:
     """Manages collection of sprites"""
     
+    __slots__ = ('sprites', 'selected_index', '_pool')
+    
     def __init__(self):
         self.sprites = []
         self.selected_index = 0
+        self._pool = []  # Removed sprites kept for reuse by spawn_sprite
     
     def add_sprite(self, sprite):
         """Add sprite to collection"""
         self.sprites.append(sprite)
         return len(self.sprites) - 1
     
+    def spawn_sprite(self, image_path, x, y):
+        """Add sprite at position, reusing a removed one when available"""
+        if self._pool:
+            sprite = self._pool.pop()
+            sprite.set_image(load_image(image_path))
+            sprite.set_position(x, y)
+        else:
+            sprite = Sprite(image_path, x, y)
+        return self.add_sprite(sprite)
+    
     def remove_sprite(self, index):
         """Remove sprite by index"""
         if 0 <= index < len(self.sprites):
-            self.sprites.pop(index)
+            self._pool.append(self.sprites.pop(index))
             self._update_selection()
     
     def remove_selected_sprite(self):
@@ -320,9 +370,8 @@ class SpriteManager:
         return len(self.sprites)
     
     def draw_all(self, surface):
-        """Draw all sprites"""
-        for sprite in self.sprites:
-            sprite.draw(surface)
+        """Draw all sprites in a single blits call"""
+        surface.blits([(sprite.image, (sprite.x, sprite.y)) for sprite in self.sprites], doreturn=False)
     
     def draw_selection_indicator(self, surface):
         """Draw selection indicator around selected sprite"""
@@ -360,7 +409,7 @@ class WindowManager:
         hwnd = pygame.display.get_wm_info()["window"]
         WindowManager._apply_transparency(hwnd)
         
-        # Ensure window is positioned correctly on the target monitor
+        # Position on the target monitor and make always on top in one call
         WindowManager._position_window_on_monitor(hwnd, monitor_info)
         
         print(f"✅ Transparent window created on main monitor: {monitor_info['width']}x{monitor_info['height']}")
@@ -388,7 +437,7 @@ class WindowManager:
     
     @staticmethod
     def _position_window_on_monitor(hwnd, monitor_info):
-        """Ensure window is positioned correctly on target monitor"""
+        """Position window on target monitor, always on top"""
         try:
             win32gui.SetWindowPos(
                 hwnd, 
@@ -404,7 +453,7 @@ class WindowManager:
     
     @staticmethod
     def _apply_transparency(hwnd):
-        """Apply Win32 transparency settings"""
+        """Apply Win32 transparency styles (topmost is set when positioning)"""
         try:
             # Set layered window
             current_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
@@ -415,12 +464,6 @@ class WindowManager:
             win32gui.SetLayeredWindowAttributes(
                 hwnd, 0x000000, 0, win32con.LWA_COLORKEY
             )
-            
-            # Always on top
-            win32gui.SetWindowPos(
-                hwnd, win32con.HWND_TOPMOST, 0, 0, 0, 0,
-                win32con.SWP_NOMOVE | win32con.SWP_NOSIZE
-            )
         except Exception as e:
             print(f"⚠️ Could not apply transparency: {e}")
 
@@ -428,9 +471,18 @@ class WindowManager:
 class AssetManager:
     """Handles asset loading and fallback creation"""
     
+    _cached_path = None  # Resolved once, reused for every spawn
+    
     @staticmethod
     def get_sprite_path():
         """Get sprite image path with fallback"""
+        if AssetManager._cached_path is None:
+            AssetManager._cached_path = AssetManager._find_sprite_path()
+        return AssetManager._cached_path
+    
+    @staticmethod
+    def _find_sprite_path():
+        """Probe the candidate paths, creating a fallback if none exist"""
         # Try multiple possible paths
         possible_paths = [
             "shime1.png",
@@ -477,6 +529,13 @@ class DesktopPetApp:
         self.show_boundaries = True
         self.transparent_mode = False
         self.monitor_info = None
+        self._keys = 0  # MovementController.KEY_BITS of held keys
+        self._dirty = []  # Rects changed since the last render
+        self._full_redraw = True  # First frame presents the whole window
+        self._font = None
+        self._monitor_surface = None
+        self._info_surface = None
+        self._info_key = None  # (selected_index, count) the info label was rendered for
         
         # Initialize systems
         self.sprite_manager = SpriteManager()
@@ -517,6 +576,12 @@ class DesktopPetApp:
             # Initialize boundary manager
             self.boundary_manager = BoundaryManager(screen_width, screen_height)
             
+            # Load the info font once; the monitor label never changes
+            self._font = pygame.font.Font(None, 24)
+            if self.monitor_info:
+                monitor_text = f"Main Monitor: {self.monitor_info['width']}x{self.monitor_info['height']}"
+                self._monitor_surface = self._font.render(monitor_text, True, (200, 200, 200))
+            
             # Load assets and create initial sprites
             self._create_initial_sprites()
             
@@ -535,12 +600,13 @@ class DesktopPetApp:
         """Create initial sprites"""
         image_path = AssetManager.get_sprite_path()
         
+        width, height = load_image(image_path).get_size()
+        
         for i in range(3):
             # Create sprite at safe position
-            temp_sprite = Sprite(image_path, 0, 0)  # Temporary for size
             try:
                 safe_x, safe_y = self.boundary_manager.get_safe_spawn_position(
-                    temp_sprite.width, temp_sprite.height
+                    width, height
                 )
             except:
                 # Fallback position if boundary calculation fails
@@ -575,42 +641,57 @@ class DesktopPetApp:
                 self.running = False
             
             elif event.type == pygame.KEYDOWN:
+                self._keys |= MovementController.KEY_BITS.get(event.key, 0)
+                
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 
                 elif event.key == pygame.K_q:
                     self.sprite_manager.select_previous()
+                    self._full_redraw = True
                     print(f"Selected sprite #{self.sprite_manager.selected_index + 1}")
                 
                 elif event.key == pygame.K_e:
                     self.sprite_manager.select_next()
+                    self._full_redraw = True
                     print(f"Selected sprite #{self.sprite_manager.selected_index + 1}")
                 
                 elif event.key == pygame.K_b:
                     self.show_boundaries = not self.show_boundaries
+                    self._full_redraw = True
                     print(f"Boundaries: {'ON' if self.show_boundaries else 'OFF'}")
                 
                 elif event.key == pygame.K_SPACE:
                     self._add_new_sprite()
+                    self._full_redraw = True
                 
                 elif event.key == pygame.K_DELETE or event.key == pygame.K_x:
                     self._remove_selected_sprite()
+                    self._full_redraw = True
+            
+            elif event.type == pygame.KEYUP:
+                self._keys &= ~MovementController.KEY_BITS.get(event.key, 0)
+            
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self._keys = 0  # KEYUPs are not delivered while unfocused
+            
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw = True
     
     def _add_new_sprite(self):
         """Add new sprite at safe position"""
         try:
             image_path = AssetManager.get_sprite_path()
-            temp_sprite = Sprite(image_path, 0, 0)
+            width, height = load_image(image_path).get_size()
             try:
                 safe_x, safe_y = self.boundary_manager.get_safe_spawn_position(
-                    temp_sprite.width, temp_sprite.height
+                    width, height
                 )
             except:
                 # Fallback position
                 safe_x, safe_y = random.randint(100, 400), random.randint(100, 300)
             
-            new_sprite = Sprite(image_path, safe_x, safe_y)
-            self.sprite_manager.add_sprite(new_sprite)
+            self.sprite_manager.spawn_sprite(image_path, safe_x, safe_y)
             print(f"➕ Added sprite #{self.sprite_manager.get_sprite_count()}")
         
         except Exception as e:
@@ -626,20 +707,32 @@ class DesktopPetApp:
     
     def update(self):
         """Update game logic"""
-        # Get movement input
-        keys = pygame.key.get_pressed()
-        dx, dy = self.movement_controller.get_movement_from_input(keys)
+        # Get movement input from keys tracked in handle_events
+        dx, dy = self.movement_controller.get_movement_from_input(self._keys)
         
         # Apply movement to selected sprite
         if dx != 0 or dy != 0:
             selected = self.sprite_manager.get_selected_sprite()
             if selected:
+                self._dirty.append(selected.get_rect().copy())  # Old position
                 self.movement_controller.apply_movement(selected, dx, dy)
                 if self.boundary_manager:
                     self.boundary_manager.clamp_position(selected)
+                self._dirty.append(selected.get_rect().copy())  # New position
     
     def render(self):
-        """Render everything"""
+        """Render everything that changed since the last frame"""
+        if not self._dirty and not self._full_redraw:
+            return
+        
+        if not self._full_redraw:
+            # Redraw only the changed area; fall back to a full frame when it is large
+            area = self._dirty[0].unionall(self._dirty[1:])
+            if area.w * area.h > 0.5 * self.display.get_width() * self.display.get_height():
+                self._full_redraw = True
+            else:
+                self.display.set_clip(area)
+        
         # Clear with black (transparent in transparent mode)
         if self.transparent_mode:
             self.display.fill((0, 0, 0))  # Black = transparent
@@ -658,19 +751,27 @@ class DesktopPetApp:
         
         # Draw info text (only in simple mode)
         if not self.transparent_mode:
-            font = pygame.font.Font(None, 24)
-            info_text = f"Sprite {self.sprite_manager.selected_index + 1}/{self.sprite_manager.get_sprite_count()}"
-            text_surface = font.render(info_text, True, (255, 255, 255))
-            self.display.blit(text_surface, (10, 10))
+            # Re-render the info label only when selection or count changes
+            info_key = (self.sprite_manager.selected_index, self.sprite_manager.get_sprite_count())
+            if info_key != self._info_key:
+                info_text = f"Sprite {info_key[0] + 1}/{info_key[1]}"
+                self._info_surface = self._font.render(info_text, True, (255, 255, 255))
+                self._info_key = info_key
+            self.display.blit(self._info_surface, (10, 10))
             
             # Show monitor info
-            if self.monitor_info:
-                monitor_text = f"Main Monitor: {self.monitor_info['width']}x{self.monitor_info['height']}"
-                monitor_surface = font.render(monitor_text, True, (200, 200, 200))
-                self.display.blit(monitor_surface, (10, 35))
+            if self._monitor_surface:
+                self.display.blit(self._monitor_surface, (10, 35))
+        
+        self.display.set_clip(None)
         
         # Update display
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)  # Present only what changed
+        self._dirty = []
+        self._full_redraw = False
     
     def run(self):
         """Main application loop"""
@@ -26,6 +26,29 @@ class FullMainWindow(QMainWindow):
     QMainWindow Example (Full Application Structure)
     HTML equivalent: Complete webpage dengan header, main, footer
     """
+    # (label, shortcut, slot name) per action; a None label is a separator
+    MENU_SPEC = (
+        ('File', (
+            ('New', 'Ctrl+N', 'new_file'),
+            ('Open', 'Ctrl+O', None),
+            (None, None, None),
+            ('Exit', None, 'close'),
+        )),
+        ('Edit', (
+            ('Copy', None, None),
+            ('Paste', None, None),
+        )),
+        ('Help', (
+            ('About', None, None),
+        )),
+    )
+    TOOLBAR_SPEC = (
+        ('New', None, 'new_file'),
+        ('Save', None, None),
+        (None, None, None),
+        ('Settings', None, None),
+    )
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Full QMainWindow Application")
@@ -44,32 +67,9 @@ class FullMainWindow(QMainWindow):
         """
         menubar = self.menuBar()  # QMainWindow built-in method
         
-        # File Menu
-        file_menu = menubar.addMenu('File')
-        
-        new_action = QAction('New', self)
-        new_action.setShortcut('Ctrl+N')
-        new_action.triggered.connect(self.new_file)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction('Open', self)
-        open_action.setShortcut('Ctrl+O')  
-        file_menu.addAction(open_action)
-        
-        file_menu.addSeparator()  # Divider line
-        
-        exit_action = QAction('Exit', self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit Menu
-        edit_menu = menubar.addMenu('Edit')
-        edit_menu.addAction('Copy')
-        edit_menu.addAction('Paste')
-        
-        # Help Menu
-        help_menu = menubar.addMenu('Help')
-        help_menu.addAction('About')
+        # File, Edit, Help menus from MENU_SPEC
+        for menu_name, entries in self.MENU_SPEC:
+            self._add_actions(menubar.addMenu(menu_name), entries)
         
     def setup_tool_bar(self):
         """
@@ -79,17 +79,20 @@ class FullMainWindow(QMainWindow):
         toolbar = self.addToolBar('Main Toolbar')  # QMainWindow method
         
         # Add quick action buttons
-        new_action = QAction('New', self)
-        new_action.triggered.connect(self.new_file)
-        toolbar.addAction(new_action)
-        
-        save_action = QAction('Save', self)
-        toolbar.addAction(save_action)
-        
-        toolbar.addSeparator()  # Separator
-        
-        settings_action = QAction('Settings', self)
-        toolbar.addAction(settings_action)
+        self._add_actions(toolbar, self.TOOLBAR_SPEC)
+        
+    def _add_actions(self, target, entries):
+        """Add (label, shortcut, slot name) entries to a menu or toolbar"""
+        for label, shortcut, slot in entries:
+            if label is None:
+                target.addSeparator()  # Divider line
+                continue
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if slot:
+                action.triggered.connect(getattr(self, slot))
+            target.addAction(action)
         
     def setup_central_widget(self):
         """
@@ -105,7 +108,7 @@ class FullMainWindow(QMainWindow):
         
         # Main content
         title = QLabel("Main Content Area")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin: 20px;")
+        title.setObjectName("contentTitle")  # Styled by the QApplication sheet
         layout.addWidget(title)
         
         description = QLabel("""
@@ -120,7 +123,7 @@ class FullMainWindow(QMainWindow):
         Perfect for full desktop applications!
         """)
         description.setWordWrap(True)
-        description.setStyleSheet("margin: 20px; line-height: 1.5;")
+        description.setObjectName("contentDescription")
         layout.addWidget(description)
         
         # Some interactive content
@@ -174,6 +177,15 @@ class QApplicationDemo:
             QPushButton:hover {
                 background-color: #005a9e;
             }
+            QLabel#contentTitle {
+                font-size: 18px;
+                font-weight: bold;
+                margin: 20px;
+            }
+            QLabel#contentDescription {
+                margin: 20px;
+                line-height: 1.5;
+            }
         """)
         
         # Create windows
@@ -5,9 +5,97 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import Qt
 import sys
 
+# Every static style in one app-level sheet, parsed once; widgets opt in with setObjectName
+# ("#header QFrame" keeps the old cascade onto child labels, which are QFrames too)
+RESPONSIVE_STYLESHEET = """
+    /* Global responsive styles */
+    * {
+        font-family: Arial, sans-serif;
+    }
+    
+    QFrame#header, QFrame#header QFrame {
+        background-color: #2c3e50;
+        color: white;
+        padding: 10px;
+    }
+    QLabel#headerTitle {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QPushButton#navButton {
+        background-color: #34495e;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        margin: 0 2px;
+    }
+    QPushButton#navButton:hover {
+        background-color: #4a6741;
+    }
+    
+    QFrame#sidebar, QFrame#sidebar QFrame {
+        background-color: #ecf0f1;
+        min-width: 200px;
+        max-width: 300px;
+    }
+    QLabel#sidebarTitle {
+        font-weight: bold;
+        padding: 10px;
+    }
+    QPushButton#sidebarButton {
+        text-align: left;
+        padding: 10px;
+        border: none;
+        background-color: transparent;
+    }
+    QPushButton#sidebarButton:hover {
+        background-color: #bdc3c7;
+    }
+    
+    QLabel#contentHeader {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 15px;
+    }
+    QTextEdit#contentText {
+        margin: 10px;
+        padding: 10px;
+    }
+    QLabel#cardTitle {
+        font-weight: bold;
+        font-size: 14px;
+    }
+    
+    QFrame#footer, QFrame#footer QFrame {
+        background-color: #34495e;
+        color: white;
+        padding: 10px;
+    }
+    
+    QFrame[card="true"], QFrame[card="true"] QFrame {
+        color: white;
+        border-radius: 8px;
+        margin: 5px;
+        min-width: 150px;
+        min-height: 100px;
+    }
+"""
+
+# Grid cards as (title, color); each color becomes one rule in the shared sheet
+CARDS = (
+    ("Card 1", "#e74c3c"), ("Card 2", "#3498db"),
+    ("Card 3", "#2ecc71"), ("Card 4", "#f39c12")
+)
+RESPONSIVE_STYLESHEET += "".join(f"""
+    QFrame#card_{i}, QFrame#card_{i} QFrame {{
+        background-color: {color};
+    }}
+""" for i, (_, color) in enumerate(CARDS))
+
 class ResponsiveDemo(QMainWindow):
     def __init__(self):
         super().__init__()
+        self._band = None  # Last size band shown in the title
         self.setup_ui()
         
     def setup_ui(self):
@@ -42,19 +130,13 @@ class ResponsiveDemo(QMainWindow):
         """
         header_frame = QFrame()
         header_frame.setFrameStyle(QFrame.StyledPanel)
-        header_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2c3e50;
-                color: white;
-                padding: 10px;
-            }
-        """)
+        header_frame.setObjectName("header")
         
         layout = QHBoxLayout(header_frame)  # display: flex; flex-direction: row;
         
         # Logo/Title (fixed width)
         title = QLabel("Responsive App")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("headerTitle")
         layout.addWidget(title)
         
         # Spacer (flex-grow: 1 - takes remaining space)
@@ -64,18 +146,7 @@ class ResponsiveDemo(QMainWindow):
         nav_buttons = ["Home", "About", "Contact"]
         for btn_text in nav_buttons:
             btn = QPushButton(btn_text)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #34495e;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    margin: 0 2px;
-                }
-                QPushButton:hover {
-                    background-color: #4a6741;
-                }
-            """)
+            btn.setObjectName("navButton")
             layout.addWidget(btn)
         
         return header_frame
@@ -113,36 +184,20 @@ class ResponsiveDemo(QMainWindow):
         """
         sidebar_frame = QFrame()
         sidebar_frame.setFrameStyle(QFrame.StyledPanel)
-        sidebar_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ecf0f1;
-                min-width: 200px;
-                max-width: 300px;
-            }
-        """)
+        sidebar_frame.setObjectName("sidebar")
         
         layout = QVBoxLayout(sidebar_frame)
         
         # Sidebar title
         title = QLabel("Sidebar Menu")
-        title.setStyleSheet("font-weight: bold; padding: 10px;")
+        title.setObjectName("sidebarTitle")
         layout.addWidget(title)
         
         # Menu items (responsive buttons)
         menu_items = ["Dashboard", "Profile", "Settings", "Reports", "Help"]
         for item in menu_items:
             btn = QPushButton(item)
-            btn.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding: 10px;
-                    border: none;
-                    background-color: transparent;
-                }
-                QPushButton:hover {
-                    background-color: #bdc3c7;
-                }
-            """)
+            btn.setObjectName("sidebarButton")
             layout.addWidget(btn)
         
         # Push menu items to top
@@ -163,7 +218,7 @@ class ResponsiveDemo(QMainWindow):
         
         # Content header
         content_header = QLabel("Main Content Area")
-        content_header.setStyleSheet("font-size: 16px; font-weight: bold; padding: 15px;")
+        content_header.setObjectName("contentHeader")
         layout.addWidget(content_header)
         
         # Responsive grid content
@@ -173,7 +228,7 @@ class ResponsiveDemo(QMainWindow):
         # Text area (responsive)
         text_area = QTextEdit()
         text_area.setPlaceholderText("This text area will resize with the window...")
-        text_area.setStyleSheet("margin: 10px; padding: 10px;")
+        text_area.setObjectName("contentText")
         layout.addWidget(text_area, 1)  # flex-grow: 1
         
         return main_frame
@@ -188,13 +243,8 @@ class ResponsiveDemo(QMainWindow):
         grid_layout = QGridLayout(grid_frame)
         
         # Create responsive cards
-        cards_data = [
-            ("Card 1", "#e74c3c"), ("Card 2", "#3498db"),
-            ("Card 3", "#2ecc71"), ("Card 4", "#f39c12")
-        ]
-        
-        for i, (title, color) in enumerate(cards_data):
-            card = self.create_responsive_card(title, color)
+        for i, (title, _) in enumerate(CARDS):
+            card = self.create_responsive_card(title, i)
             row = i // 2  # 2 cards per row
             col = i % 2
             grid_layout.addWidget(card, row, col)
@@ -205,7 +255,7 @@ class ResponsiveDemo(QMainWindow):
         
         return grid_frame
     
-    def create_responsive_card(self, title, color):
+    def create_responsive_card(self, title, index):
         """
         Responsive Card Component
         HTML/CSS equivalent:
@@ -213,22 +263,14 @@ class ResponsiveDemo(QMainWindow):
         """
         card = QFrame()
         card.setFrameStyle(QFrame.StyledPanel)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {color};
-                color: white;
-                border-radius: 8px;
-                margin: 5px;
-                min-width: 150px;
-                min-height: 100px;
-            }}
-        """)
+        card.setObjectName(f"card_{index}")  # Color rule from CARDS in RESPONSIVE_STYLESHEET
+        card.setProperty("card", True)
         
         layout = QVBoxLayout(card)
         
         card_title = QLabel(title)
         card_title.setAlignment(Qt.AlignCenter)
-        card_title.setStyleSheet("font-weight: bold; font-size: 14px;")
+        card_title.setObjectName("cardTitle")
         layout.addWidget(card_title)
         
         card_content = QLabel("Responsive content")
@@ -245,13 +287,7 @@ class ResponsiveDemo(QMainWindow):
         """
         footer_frame = QFrame()
         footer_frame.setFrameStyle(QFrame.StyledPanel)
-        footer_frame.setStyleSheet("""
-            QFrame {
-                background-color: #34495e;
-                color: white;
-                padding: 10px;
-            }
-        """)
+        footer_frame.setObjectName("footer")
         
         layout = QHBoxLayout(footer_frame)
         
@@ -273,32 +309,27 @@ class ResponsiveDemo(QMainWindow):
         """
         super().resizeEvent(event)
         
-        # Get new window size
-        new_size = event.size()
-        width = new_size.width()
-        height = new_size.height()
+        # Get new window width (breakpoints only depend on width)
+        width = event.size().width()
         
         # Custom responsive logic berdasarkan ukuran
         if width < 600:
-            # Small screen behavior
-            self.setWindowTitle(f"Responsive App (Small: {width}x{height})")
+            band = "Small"  # Small screen behavior
         elif width < 900:
-            # Medium screen behavior  
-            self.setWindowTitle(f"Responsive App (Medium: {width}x{height})")
+            band = "Medium"  # Medium screen behavior
         else:
-            # Large screen behavior
-            self.setWindowTitle(f"Responsive App (Large: {width}x{height})")
+            band = "Large"  # Large screen behavior
+        
+        # Only touch the title when crossing a breakpoint, not on every resize pixel
+        if band != self._band:
+            self._band = band
+            self.setWindowTitle(f"Responsive App ({band})")
 
 def main():
     app = QApplication(sys.argv)
     
-    # Set application-wide responsive behavior
-    app.setStyleSheet("""
-        /* Global responsive styles */
-        * {
-            font-family: Arial, sans-serif;
-        }
-    """)
+    # Set application-wide responsive behavior (all static styles, parsed once)
+    app.setStyleSheet(RESPONSIVE_STYLESHEET)
     
     window = ResponsiveDemo()
     window.show()
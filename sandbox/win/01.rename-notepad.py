@@ -6,14 +6,23 @@ import win32gui
 def cari_notepad():
     print("🔍 Mencari window Notepad...")
     
-    # Cari window dengan nama "Notepad"
-    notepad_window = win32gui.FindWindow(None, "Untitled - Notepad")
+    # Kumpulkan semua window yang judulnya mengandung "Notepad"
+    # (satu kali EnumWindows, jadi "Catatan.txt - Notepad" juga ketemu)
+    ditemukan = []
     
-    if notepad_window == 0:
+    def cek_window(hwnd, _):
+        if win32gui.IsWindowVisible(hwnd) and "Notepad" in win32gui.GetWindowText(hwnd):
+            ditemukan.append(hwnd)
+        return True
+    
+    win32gui.EnumWindows(cek_window, None)
+    
+    if not ditemukan:
         print("❌ Notepad tidak ditemukan!")
         print("💡 Buka Notepad dulu, lalu jalankan program ini lagi")
         return None
     
+    notepad_window = ditemukan[0]
     print(f"✅ Notepad ditemukan! ID: {notepad_window}")
     return notepad_window
 
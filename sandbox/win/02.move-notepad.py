@@ -5,17 +5,25 @@ import time
 
 def cari_notepad():
     """Cari window Notepad"""
-    notepad = win32gui.FindWindow(None, "Untitled - Notepad")
+    # Satu kali EnumWindows: cocokkan judul yang mengandung "Notepad"
+    # atau judul hasil 01.rename-notepad.py
+    ditemukan = []
     
-    if notepad == 0:
-        notepad = win32gui.FindWindow(None, "🎉 HELLO WIN32! 🎉")  # Coba nama lain juga
+    def cek_window(hwnd, _):
+        if win32gui.IsWindowVisible(hwnd):
+            judul = win32gui.GetWindowText(hwnd)
+            if "Notepad" in judul or judul == "🎉 HELLO WIN32! 🎉":
+                ditemukan.append(hwnd)
+        return True
     
-    if notepad == 0:
+    win32gui.EnumWindows(cek_window, None)
+    
+    if not ditemukan:
         print("❌ Buka Notepad dulu!")
         return None
         
     print("✅ Notepad ditemukan!")
-    return notepad
+    return ditemukan[0]
 
 def gerakkan_window(window_id):
     """Gerakkan window ke posisi berbeda"""
@@ -30,11 +38,13 @@ def gerakkan_window(window_id):
         (250, 200)    # Tengah
     ]
     
+    SetWindowPos = win32gui.SetWindowPos  # Ambil sekali di luar loop
+    
     for i, (x, y) in enumerate(posisi):
         print(f"  📍 Pindah ke posisi {i+1}: ({x}, {y})")
         
         # Pindahkan window ke posisi (x, y) dengan ukuran 300x200
-        win32gui.SetWindowPos(
+        SetWindowPos(
             window_id,  # Window yang mau dipindah
             0,          # Tidak perlu always on top
             x, y,       # Posisi baru
@@ -59,11 +69,13 @@ def ubah_ukuran_window(window_id):
         (300, 200)    # Normal
     ]
     
+    SetWindowPos = win32gui.SetWindowPos  # Ambil sekali di luar loop
+    
     for i, (width, height) in enumerate(ukuran):
         print(f"  📐 Ukuran {i+1}: {width} x {height}")
         
         # Ubah ukuran (posisi tetap di 250, 200)
-        win32gui.SetWindowPos(
+        SetWindowPos(
             window_id,
             0,
             250, 200,        # Posisi tetap
@@ -6,18 +6,26 @@ import time
 
 def cari_notepad():
     """Cari window Notepad"""
-    notepad = win32gui.FindWindow(None, "Untitled - Notepad")
+    # Satu kali EnumWindows: cocokkan judul yang mengandung "Notepad"
+    # atau judul hasil 01.rename-notepad.py
+    ditemukan = []
     
-    if notepad == 0:
-        notepad = win32gui.FindWindow(None, "🎉 HELLO WIN32! 🎉")
+    def cek_window(hwnd, _):
+        if win32gui.IsWindowVisible(hwnd):
+            judul = win32gui.GetWindowText(hwnd)
+            if "Notepad" in judul or judul == "🎉 HELLO WIN32! 🎉":
+                ditemukan.append(hwnd)
+        return True
     
-    if notepad == 0:
+    win32gui.EnumWindows(cek_window, None)
+    
+    if not ditemukan:
         print("❌ Buka Notepad dulu!")
         print("💡 Buka Notepad, lalu jalankan program ini")
         return None
         
     print("✅ Notepad ditemukan!")
-    return notepad
+    return ditemukan[0]
 
 def buat_transparan(window_id):
     """Buat window jadi transparan"""
@@ -71,11 +79,13 @@ def demo_transparansi(window_id):
         (255, "Kembali normal")
     ]
     
+    SetLayeredWindowAttributes = win32gui.SetLayeredWindowAttributes  # Ambil sekali di luar loop
+    
     for level, desc in levels:
         print(f"  👀 {desc} (level: {level})")
         
         # Set transparansi
-        win32gui.SetLayeredWindowAttributes(
+        SetLayeredWindowAttributes(
             window_id, 0, level, win32con.LWA_ALPHA
         )
         
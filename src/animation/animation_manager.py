@@ -2,10 +2,12 @@
 # This module will be the MAESTRO - Central animation controller
 
 import pygame
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from ..utils.log_manager import get_logger
-from .sprite_loader import SpriteLoader
+from .sprite_loader import SpriteLoader, get_shared_loader
 
 class AnimationManager:
     """MAESTRO - Central animation controller for sprite animations"""
@@ -29,6 +31,8 @@ class AnimationManager:
         self.current_frames = []
         self.frame_durations = []
         self.frame_anchors = []  # Store anchor points for each frame
+        self.frame_end_times = []  # Prefix sums of frame_durations
+        self.total_duration = 0
         self.is_animating = False
         
         # Action navigation
@@ -41,8 +45,8 @@ class AnimationManager:
         self.sound_enabled = True
         self.volume = 0.5  # Default volume (0.0 to 1.0)
         
-        # Sprite loader integration
-        self.sprite_loader = sprite_loader or SpriteLoader()
+        # Sprite loader integration (shared cache unless one is passed in)
+        self.sprite_loader = sprite_loader or get_shared_loader()
         
         # Initialize pygame mixer if not already initialized
         if not pygame.mixer.get_init():
@@ -234,9 +238,9 @@ class AnimationManager:
         
         if self.current_frames:
             self.current_image = self.current_frames[0]
+            self._build_frame_timeline()
             # Set is_animating based on number of frames and total duration
-            total_duration = sum(self.frame_durations)
-            self.is_animating = len(self.current_frames) > 1 and total_duration > 0
+            self.is_animating = len(self.current_frames) > 1 and self.total_duration > 0
             
             # Reset animation state
             self.current_frame = 0
@@ -251,6 +255,13 @@ class AnimationManager:
             self.logger.warning(f"No frames loaded for action '{action_name}'")
             self.is_animating = False
     
+    def _build_frame_timeline(self):
+        """Precompute frame end times so update_animation can bisect"""
+        # A 0-duration frame adds no width to the timeline, so it is never shown;
+        # if every frame is 0, total_duration is 0 and the action does not animate
+        self.frame_end_times = list(accumulate(self.frame_durations))
+        self.total_duration = self.frame_end_times[-1] if self.frame_end_times else 0
+    
     def _load_frame_image(self, image_name: str) -> Optional[pygame.Surface]:
         """Load frame image using SpriteLoader"""
         if not self.sprite_path:
@@ -323,25 +334,27 @@ class AnimationManager:
             return 1  # Default to 1 if not found
     
     def update_animation(self, delta_time: float):
-        """Update animation with proper timing and sound"""
+        """Update animation with proper timing and sound (0-duration frames are skipped)"""
         if not self.is_animating or not self.current_frames or len(self.current_frames) <= 1:
             return
+        if self.total_duration <= 0:
+            return  # All frames are 0-duration; no loop to advance through
         
-        self.animation_timer += delta_time
+        # Position within the loop; the frame is found by bisecting the
+        # prefix sums, so large deltas skip frames in O(log n)
+        self.animation_timer = (self.animation_timer + delta_time) % self.total_duration
+        new_frame = bisect_right(self.frame_end_times, self.animation_timer)
         
-        # Check if it's time for next frame
-        if self.animation_timer >= self.frame_durations[self.current_frame]:
-            self.animation_timer = 0
+        if new_frame != self.current_frame:
             old_frame = self.current_frame
-            self.current_frame = (self.current_frame + 1) % len(self.current_frames)
-            self.current_image = self.current_frames[self.current_frame]
+            self.current_frame = new_frame
+            self.current_image = self.current_frames[new_frame]
             
             # Play sound for new frame if available
-            self._play_frame_sound(self.current_frame)
+            self._play_frame_sound(new_frame)
             
             # Debug logging for frame changes
-            if old_frame != self.current_frame:
-                self.logger.debug(f"Frame changed: {old_frame} -> {self.current_frame} (action: {self.current_action})")
+            self.logger.debug(f"Frame changed: {old_frame} -> {new_frame} (action: {self.current_action})")
     
     def get_current_image(self) -> Optional[pygame.Surface]:
         """Get current frame image"""
@@ -479,6 +492,7 @@ class AnimationManager:
         # Restore frame durations if available
         if checkpoint['frame_durations'] and len(checkpoint['frame_durations']) == len(self.frame_durations):
             self.frame_durations = checkpoint['frame_durations']
+            self._build_frame_timeline()
         
         self.logger.info(f"Restored animation checkpoint: {self.current_action}")
         return True
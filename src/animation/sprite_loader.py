@@ -3,6 +3,8 @@
 
 import pygame
 import os
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from collections import OrderedDict
@@ -32,26 +34,33 @@ class SpriteLoader:
         self.current_memory_usage = 0
         self.sprite_sizes = {}
         
+        # Sprites loaded before a display mode existed (converted lazily)
+        self.unconverted_sprites = set()
+        
         # Check if pygame display is initialized
         self.display_initialized = pygame.display.get_init()
         
         self.logger.info(f"SpriteLoader initialized with cache_size={cache_size}, memory_limit={memory_limit_mb}MB")
         self.logger.info(f"Pygame display initialized: {self.display_initialized}")
     
-    def load_sprite(self, sprite_path: str) -> Optional[pygame.Surface]:
-        """Load sprite with smart caching and memory management"""
+    def load_sprite(self, sprite_path: str, data: Optional[bytes] = None) -> Optional[pygame.Surface]:
+        """Load sprite with smart caching and memory management (data: file bytes already read)"""
         try:
             # Check if sprite is already cached
             if sprite_path in self.sprite_cache:
                 # Move to end (LRU)
                 sprite = self.sprite_cache.pop(sprite_path)
+                if sprite_path in self.unconverted_sprites:
+                    sprite, converted = self._convert_for_display(sprite)
+                    if converted:
+                        self.unconverted_sprites.discard(sprite_path)
                 self.sprite_cache[sprite_path] = sprite
                 self.cache_stats['hits'] += 1
                 return sprite
             
             # Cache miss - load from disk
             self.cache_stats['misses'] += 1
-            sprite = self._load_from_disk(sprite_path)
+            sprite = self._load_from_disk(sprite_path, data)
             
             if sprite is not None:
                 # Add to cache with memory management
@@ -66,37 +75,27 @@ class SpriteLoader:
             self.logger.error(f"Error loading sprite {sprite_path}: {e}")
             return None
     
-    def _load_from_disk(self, sprite_path: str) -> Optional[pygame.Surface]:
-        """Load sprite from disk with error handling"""
+    def _load_from_disk(self, sprite_path: str, data: Optional[bytes] = None) -> Optional[pygame.Surface]:
+        """Load sprite from disk (or from prefetched file bytes) with error handling"""
         try:
-            # Check if file exists
-            if not os.path.exists(sprite_path):
-                self.logger.warning(f"Sprite file not found: {sprite_path}")
-                return None
-            
-            # Try to load the sprite
-            sprite = pygame.image.load(sprite_path)
+            if data is not None:
+                # Decode bytes read ahead by preload_sprites; the path is the format hint
+                sprite = pygame.image.load(io.BytesIO(data), sprite_path)
+            else:
+                # Check if file exists
+                if not os.path.exists(sprite_path):
+                    self.logger.warning(f"Sprite file not found: {sprite_path}")
+                    return None
+                
+                # Try to load the sprite
+                sprite = pygame.image.load(sprite_path)
 
-            # Convert to optimize for display - handle display not initialized
-            try:
-                if sprite.get_alpha() is None:
-                    sprite = sprite.convert()
-                else:
-                    sprite = sprite.convert_alpha()
-            except pygame.error as e:
-                if "cannot convert without pygame.display initialized" in str(e):
-                    # Create a dummy display surface for conversion
-                    try:
-                        dummy_surface = pygame.Surface((1, 1))
-                        if sprite.get_alpha() is None:
-                            sprite = sprite.convert(dummy_surface)
-                        else:
-                            sprite = sprite.convert_alpha(dummy_surface)
-                    except:
-                        # If all else fails, use as-is
-                        pass
-                else:
-                    raise e
+            # Convert to display pixel format so blits take the fast path
+            sprite, converted = self._convert_for_display(sprite)
+            if not converted:
+                # No display mode yet - convert on a later cache hit
+                self.unconverted_sprites.add(sprite_path)
+                self.logger.debug(f"Display not ready, deferring conversion of {sprite_path}")
 
             # Preprocess alpha pixels to prevent bleeding
             sprite = self._preprocess_alpha_pixels(sprite)
@@ -111,6 +110,16 @@ class SpriteLoader:
             self.logger.error(f"Unexpected error loading {sprite_path}: {e}")
             return None
     
+    def _convert_for_display(self, sprite: pygame.Surface) -> Tuple[pygame.Surface, bool]:
+        """Convert sprite to the display pixel format, returns (sprite, converted)"""
+        # convert()/convert_alpha() need a video mode, even with a reference surface
+        if pygame.display.get_surface() is None:
+            return sprite, False
+        
+        if sprite.get_flags() & pygame.SRCALPHA or sprite.get_alpha() is not None:
+            return sprite.convert_alpha(), True
+        return sprite.convert(), True
+    
     def _preprocess_sprite_for_transparency(self, sprite: pygame.Surface, transparency_color=(255, 0, 255)) -> pygame.Surface:
         """Preprocess sprite to avoid color key conflicts"""
         try:
@@ -249,6 +258,7 @@ class SpriteLoader:
         # Remove oldest sprite
         oldest_path, oldest_sprite = self.sprite_cache.popitem(last=False)
         oldest_size = self.sprite_sizes.pop(oldest_path, 0)
+        self.unconverted_sprites.discard(oldest_path)
         self.current_memory_usage -= oldest_size
         self.cache_stats['evictions'] += 1
         
@@ -265,6 +275,8 @@ class SpriteLoader:
         preload_results = {}
         loaded_count = 0
         
+        # Frame image paths in load order (first animation block of each action)
+        image_paths = []
         for action_name, action_data in actions.items():
             if not action_data.animation_blocks:
                 continue
@@ -275,21 +287,39 @@ class SpriteLoader:
             for frame in anim_block.frames:
                 # Remove leading slash from image path
                 image_name = frame.image.lstrip('/')
-                image_path = sprite_path / image_name
-                if image_path.exists():
-                    sprite = self.load_sprite(str(image_path))
-                    if sprite is not None:
-                        preload_results[str(image_path)] = True
-                        loaded_count += 1
-                    else:
-                        preload_results[str(image_path)] = False
+                image_paths.append(sprite_path / image_name)
+        
+        # Read uncached files on worker threads so disk reads overlap; decoding
+        # and display conversion stay on this thread
+        to_read = list(dict.fromkeys(p for p in image_paths if not self.is_cached(str(p)) and p.exists()))
+        prefetched = {}
+        if to_read:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as executor:
+                prefetched = dict(zip(to_read, executor.map(self._read_sprite_bytes, to_read)))
+        
+        for image_path in image_paths:
+            if image_path.exists():
+                sprite = self.load_sprite(str(image_path), prefetched.pop(image_path, None))
+                if sprite is not None:
+                    preload_results[str(image_path)] = True
+                    loaded_count += 1
                 else:
                     preload_results[str(image_path)] = False
-                    self.logger.warning(f"Sprite not found: {image_path}")
+            else:
+                preload_results[str(image_path)] = False
+                self.logger.warning(f"Sprite not found: {image_path}")
         
         self.logger.info(f"Preloaded {loaded_count} sprites for {sprite_pack}/{action_type}")
         return preload_results
     
+    def _read_sprite_bytes(self, sprite_path: Path) -> Optional[bytes]:
+        """Read a sprite file's bytes (runs on preload worker threads)"""
+        try:
+            return sprite_path.read_bytes()
+        except OSError as e:
+            self.logger.warning(f"Failed to read {sprite_path}: {e}")
+            return None
+    
     def get_sprite(self, sprite_path: str) -> Optional[pygame.Surface]:
         """Get sprite from cache or load if not cached (alias for load_sprite)"""
         return self.load_sprite(sprite_path)
@@ -298,6 +328,7 @@ class SpriteLoader:
         """Clear entire sprite cache"""
         self.sprite_cache.clear()
         self.sprite_sizes.clear()
+        self.unconverted_sprites.clear()
         self.current_memory_usage = 0
         self.cache_stats['evictions'] += len(self.sprite_cache)
         
@@ -329,4 +360,21 @@ class SpriteLoader:
     
     def is_cached(self, sprite_path: str) -> bool:
         """Check if sprite is cached"""
-        return sprite_path in self.sprite_cache 
\ No newline at end of file
+        return sprite_path in self.sprite_cache
+
+
+# Loader shared by every AnimationManager not given its own, so pets and
+# action switches reuse one sprite cache instead of each starting empty
+_shared_loader: Optional[SpriteLoader] = None
+
+def get_shared_loader() -> SpriteLoader:
+    """Get the shared sprite loader, creating a default one on first use"""
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = SpriteLoader()
+    return _shared_loader
+
+def set_shared_loader(loader: SpriteLoader):
+    """Make loader the shared sprite loader (e.g. one built from settings)"""
+    global _shared_loader
+    _shared_loader = loader
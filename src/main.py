@@ -18,7 +18,7 @@ from .utils.json_parser import JSONParser
 from .utils.settings_manager import SettingsManager
 from .utils.performance_monitor import performance_monitor
 from .utils.memory_manager import memory_manager
-from .animation.sprite_loader import SpriteLoader
+from .animation.sprite_loader import SpriteLoader, set_shared_loader
 
 # Optional Win32 imports with fallback
 try:
@@ -138,6 +138,8 @@ class DesktopPetApp:
                 memory_limit_mb=self.settings_manager.get_setting('sprites.memory_limit_mb', 50),
                 settings_manager=self.settings_manager
             )
+            # Pets' AnimationManagers load through this configured cache
+            set_shared_loader(self.sprite_loader)
             
             # Add sprite loader cleanup callback
             if hasattr(self, 'sprite_loader'):
@@ -16,7 +16,7 @@ from typing import Dict, List, Optional, Any
 from .xml2json import XML2JSONConverter
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameData:
     """Single animation frame data"""
     image: str
@@ -15,7 +15,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameData:
     """Single animation frame data"""
     image: str
@@ -70,6 +70,38 @@ class ConversionResult:
     success: bool = False
 
 
+# Parsed "x,y" attribute strings; sprite packs repeat the same few anchors
+# and velocities across hundreds of poses, so each is parsed once.
+_PAIR_CACHE: Dict[str, Optional[Tuple[float, float]]] = {}
+
+
+def _parse_pair(text: str) -> Optional[Tuple[float, float]]:
+    """
+    Parse an "x,y" attribute into a float pair
+    
+    Args:
+        text: Attribute value such as "64,128"
+        
+    Returns:
+        (x, y) tuple, or None if the value is not exactly two numbers
+    """
+    try:
+        return _PAIR_CACHE[text]
+    except KeyError:
+        pass
+    
+    head, sep, tail = text.partition(',')
+    pair = None
+    if sep and ',' not in tail:
+        try:
+            pair = (float(head), float(tail))
+        except ValueError:
+            pass
+    
+    _PAIR_CACHE[text] = pair
+    return pair
+
+
 class XML2JSONConverter:
     """
     Converts XML files to JSON structure.
@@ -424,33 +456,15 @@ class XML2JSONConverter:
                     print(f"⚠️ Skipping frame {image}: ImageAnchor missing")
                 return None
             
-            try:
-                # Parse "64,128" format to (64, 128)
-                anchor_parts = image_anchor_str.split(',')
-                if len(anchor_parts) != 2:
-                    if self.debug_mode:
-                        print(f"⚠️ Skipping frame {image}: Invalid ImageAnchor format '{image_anchor_str}'")
-                    return None
-                
-                anchor_x = float(anchor_parts[0].strip())
-                anchor_y = float(anchor_parts[1].strip())
-                image_anchor = (anchor_x, anchor_y)
-                
-            except (ValueError, IndexError) as e:
+            # Parse "64,128" format to (64.0, 128.0)
+            image_anchor = _parse_pair(image_anchor_str)
+            if image_anchor is None:
                 if self.debug_mode:
-                    print(f"⚠️ Skipping frame {image}: Invalid ImageAnchor '{image_anchor_str}' - {e}")
+                    print(f"⚠️ Skipping frame {image}: Invalid ImageAnchor '{image_anchor_str}'")
                 return None
             
             # Parse velocity from "x,y" format
-            try:
-                vel_parts = velocity.split(',')
-                if len(vel_parts) == 2:
-                    vel_x = float(vel_parts[0].strip())
-                    vel_y = float(vel_parts[1].strip())
-                else:
-                    vel_x = vel_y = 0.0
-            except (ValueError, IndexError):
-                vel_x = vel_y = 0.0
+            vel_x, vel_y = _parse_pair(velocity) or (0.0, 0.0)
             
             # Convert to proper types
             try:
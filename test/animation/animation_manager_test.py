@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+test/animation/animation_manager_test.py - Frame Timing Tests for AnimationManager
+
+Tests update_animation frame selection:
+- Frame sequence for small steps
+- Large delta skipping frames
+- Wrap back to frame 0 after the last frame
+- Zero-duration frames being skipped
+- Single-frame actions staying still
+"""
+
+import os
+import unittest
+from pathlib import Path
+import sys
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.animation.animation_manager import AnimationManager
+
+
+class TestAnimationManagerTiming(unittest.TestCase):
+    """Frame timing tests for AnimationManager.update_animation"""
+
+    # Binary fractions so the timer sums exactly
+    DURATIONS = [0.25, 0.5, 0.25]
+
+    def setUp(self):
+        """Set up a manager playing three frames"""
+        self.manager = AnimationManager()
+        self.manager.sound_enabled = False
+        self._set_frames(self.DURATIONS)
+
+    def _set_frames(self, durations):
+        """Load placeholder frames the way _load_action_frames does"""
+        manager = self.manager
+        manager.current_frames = [pygame.Surface((1, 1)) for _ in durations]
+        manager.frame_durations = list(durations)
+        manager.frame_anchors = [None] * len(durations)
+        manager.frame_sounds = [None] * len(durations)
+        manager._build_frame_timeline()
+        manager.is_animating = len(manager.current_frames) > 1 and manager.total_duration > 0
+        manager.current_frame = 0
+        manager.current_image = manager.current_frames[0]
+        manager.animation_timer = 0
+
+    def _step(self, delta_time, count):
+        """Advance count times and return the frame after each step"""
+        frames = []
+        for _ in range(count):
+            self.manager.update_animation(delta_time)
+            frames.append(self.manager.current_frame)
+        return frames
+
+    def test_timeline(self):
+        """Test frame end times and total duration"""
+        self.assertEqual(self.manager.frame_end_times, [0.25, 0.75, 1.0])
+        self.assertEqual(self.manager.total_duration, 1.0)
+
+    def test_frame_sequence(self):
+        """Test frame sequence for steps shorter than a frame, including the wrap"""
+        frames = self._step(0.125, 8)
+        self.assertEqual(frames, [0, 1, 1, 1, 1, 2, 2, 0])
+        self.assertEqual(self.manager.animation_timer, 0.0)
+
+    def test_current_image_follows_frame(self):
+        """Test current_image tracks current_frame"""
+        for _ in range(8):
+            self.manager.update_animation(0.125)
+            self.assertIs(self.manager.current_image,
+                          self.manager.current_frames[self.manager.current_frame])
+
+    def test_large_delta_skips_frames(self):
+        """Test one large delta lands on the right frame without stepping"""
+        self.manager.update_animation(0.75)
+        self.assertEqual(self.manager.current_frame, 2)
+
+        # Several whole loops plus a remainder
+        self.manager.update_animation(2.5)
+        self.assertEqual(self.manager.animation_timer, 0.25)
+        self.assertEqual(self.manager.current_frame, 1)
+
+    def test_wrap_to_first_frame(self):
+        """Test the last frame wraps back to frame 0"""
+        self.manager.update_animation(0.875)
+        self.assertEqual(self.manager.current_frame, 2)
+        self.manager.update_animation(0.25)
+        self.assertEqual(self.manager.current_frame, 0)
+        self.assertEqual(self.manager.animation_timer, 0.125)
+
+    def test_zero_duration_frames_skipped(self):
+        """Test 0-duration frames between timed frames are never shown"""
+        self._set_frames([0.25, 0, 0.5, 0.25])
+        self.assertEqual(self.manager.frame_end_times, [0.25, 0.25, 0.75, 1.0])
+        frames = self._step(0.125, 8)
+        self.assertEqual(frames, [0, 2, 2, 2, 2, 3, 3, 0])
+        self.assertNotIn(1, frames)
+
+    def test_all_zero_durations_not_animated(self):
+        """Test an action whose frames are all 0-duration stays on frame 0"""
+        self._set_frames([0, 0, 0])
+        self.assertEqual(self.manager.total_duration, 0)
+        self.assertFalse(self.manager.is_animating)
+        self.assertEqual(self._step(0.125, 4), [0, 0, 0, 0])
+
+        # Guarded even if is_animating is forced on (e.g. a restored checkpoint)
+        self.manager.is_animating = True
+        self.assertEqual(self._step(0.125, 4), [0, 0, 0, 0])
+        self.assertEqual(self.manager.animation_timer, 0)
+
+    def test_single_frame_not_animated(self):
+        """Test a single-frame action never advances"""
+        self._set_frames([0.5])
+        self.assertFalse(self.manager.is_animating)
+        self.assertEqual(self._step(0.3, 4), [0, 0, 0, 0])
+        self.assertEqual(self.manager.animation_timer, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()